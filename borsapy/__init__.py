@@ -106,6 +106,7 @@ Examples:
     >>> result = bp.backtest("THYAO", rsi_strategy, period="1y", indicators=['rsi'])
     >>> print(result.summary())
     >>> print(f"Win Rate: {result.win_rate:.1f}%")
+    >>> results = bp.backtest_many(["THYAO", "GARAN"], rsi_strategy)  # Parallel
 
     # Pine Script streaming indicators
     >>> stream = bp.TradingViewStream()
@@ -130,10 +131,10 @@ from borsapy._providers.twitter import (
     get_twitter_auth,
     set_twitter_auth,
 )
-from borsapy.backtest import Backtest, BacktestResult, Trade, backtest
+from borsapy.backtest import Backtest, BacktestResult, Trade, backtest, backtest_many
 from borsapy.bond import Bond, bonds, risk_free_rate
 from borsapy.calendar import EconomicCalendar, economic_calendar
-from borsapy.charts import calculate_heikin_ashi
+from borsapy.charts import calculate_heikin_ashi, calculate_heikin_ashi_bulk
 from borsapy.crypto import Crypto, crypto_pairs
 from borsapy.eurobond import Eurobond, eurobonds
 from borsapy.evds import (
@@ -303,6 +304,7 @@ __all__ = [
     "calculate_tema",
     # Charts
     "calculate_heikin_ashi",
+    "calculate_heikin_ashi_bulk",
     # Replay
     "ReplaySession",
     "create_replay",
@@ -327,6 +329,7 @@ __all__ = [
     "BacktestResult",
     "Trade",
     "backtest",
+    "backtest_many",
     # Tax
     "withholding_tax_rate",
     "withholding_tax_table",
@@ -9,6 +9,7 @@ Uses pymupdf4llm for PDF to markdown conversion and OpenRouter LLM for parsing.
 import json
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -28,7 +29,7 @@ CACHE_DURATION = 3600  # 1 hour
 OPENROUTER_MODEL = "google/gemini-3-flash-preview"
 
 
-@dataclass
+@dataclass(slots=True)
 class Holding:
     """Represents a single holding in a fund portfolio."""
 
@@ -66,6 +67,14 @@ class KAPHoldingsProvider(BaseProvider):
         self._fund_id_cache: dict[str, str] = {}
         self._holdings_cache: dict[str, tuple[list[Holding], datetime]] = {}
         self._holdings_cache_time: dict[str, float] = {}
+        self._disclosures_cache: dict[tuple[str, int], tuple[list[dict[str, Any]], float]] = {}
+
+    def clear_cache(self) -> None:
+        """Clear cached fund IDs, disclosures and holdings."""
+        self._fund_id_cache.clear()
+        self._disclosures_cache.clear()
+        self._holdings_cache.clear()
+        self._holdings_cache_time.clear()
 
     def get_fund_id(self, fund_code: str) -> str | None:
         """
@@ -128,6 +137,17 @@ class KAPHoldingsProvider(BaseProvider):
         Returns:
             List of disclosures with disclosure_id, disclosure_index, publish_date, etc.
         """
+        fund_code = fund_code.upper()
+        cache_key = (fund_code, days)
+        current_time = time.time()
+
+        # Check cache
+        if cache_key in self._disclosures_cache:
+            disclosures, cache_time = self._disclosures_cache[cache_key]
+            if (current_time - cache_time) < CACHE_DURATION:
+                # Hand out copies so callers can't mutate the cached entries
+                return [d.copy() for d in disclosures]
+
         fund_id = self.get_fund_id(fund_code)
         if not fund_id:
             raise DataNotAvailableError(f"Fund not found in KAP: {fund_code}")
@@ -153,11 +173,12 @@ class KAPHoldingsProvider(BaseProvider):
                     "attachment_count": basic.get("attachmentCount", 0),
                 })
 
-            return disclosures
-
         except Exception as e:
             raise APIError(f"Failed to fetch disclosures for {fund_code}: {e}") from e
 
+        self._disclosures_cache[cache_key] = (disclosures, current_time)
+        return [d.copy() for d in disclosures]
+
     def get_latest_disclosure(self, fund_code: str) -> dict[str, Any] | None:
         """Get the most recent portfolio distribution report disclosure."""
         disclosures = self.get_disclosures(fund_code, days=365)
@@ -520,22 +541,63 @@ DATA:
                 'symbol', 'isin', 'name', 'weight', 'type', 'country', 'value'
             ])
 
-        records = []
-        for h in holdings:
-            records.append({
-                'symbol': h.symbol,
-                'isin': h.isin,
-                'name': h.name,
-                'weight': h.weight,
-                'type': h.holding_type,
-                'country': h.country,
-                'value': h.market_value,
-            })
-
-        df = pd.DataFrame(records)
-        df = df.sort_values('weight', ascending=False).reset_index(drop=True)
+        df = pd.DataFrame({
+            'symbol': [h.symbol for h in holdings],
+            'isin': [h.isin for h in holdings],
+            'name': [h.name for h in holdings],
+            'weight': [h.weight for h in holdings],
+            'type': [h.holding_type for h in holdings],
+            'country': [h.country for h in holdings],
+            'value': [h.market_value for h in holdings],
+        })
+        df.sort_values('weight', ascending=False, inplace=True, ignore_index=True)
         return df
 
+    def get_holdings_batch(
+        self,
+        fund_codes: list[str],
+        api_key: str,
+        period: str | None = None,
+        max_workers: int = 8,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Get holdings DataFrames for several funds concurrently.
+
+        Each fund still needs its own KAP disclosure lookup, PDF download and
+        LLM call, so these are fanned out over a thread pool instead of being
+        run one after another.
+
+        Args:
+            fund_codes: TEFAS fund codes (e.g., ["YAY", "AAK"])
+            api_key: OpenRouter API key for LLM parsing
+            period: Optional period in format "YYYY-MM"
+            max_workers: Concurrent request workers.
+
+        Returns:
+            Dict mapping upper-cased fund code to its holdings DataFrame,
+            in input order.
+
+        Raises:
+            DataNotAvailableError: If any fund or its holdings are not found.
+            APIError: If any API request fails.
+
+        Note:
+            The batch is all-or-nothing: the first fund that raises aborts it
+            and no partial result is returned. Call get_holdings_df() per fund
+            to handle failures individually.
+        """
+        codes = list(dict.fromkeys(code.upper() for code in fund_codes))
+        if not codes:
+            return {}
+
+        workers = max(1, min(max_workers, len(codes)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            frames = pool.map(
+                lambda code: self.get_holdings_df(code, api_key, period),
+                codes,
+            )
+            return dict(zip(codes, frames, strict=True))
+
 
 # Singleton
 _provider: KAPHoldingsProvider | None = None
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
+from urllib.parse import quote
 
 from borsapy._providers.base import BaseProvider
 from borsapy._providers.tradingview import get_tradingview_auth
@@ -51,7 +53,31 @@ INDICATOR_OUTPUTS = {
     "STD;CMF": {"plot_0": "value"},
 }
 
-# Module-level cache for indicator metadata
+# URL path segments for the standard indicators, encoded once at import
+_ENCODED_IDS = {
+    indicator_id: quote(indicator_id, safe="") for indicator_id in STANDARD_INDICATORS.values()
+}
+
+
+def _normalize_indicator_id(indicator_id: str) -> str:
+    """Map a short name or full ID to the full TradingView indicator ID."""
+    # Already full ID format (short names never contain ";")
+    if ";" in indicator_id:
+        return indicator_id
+
+    # Short name (keys are upper-case), else try as standard indicator
+    full_id = STANDARD_INDICATORS.get(indicator_id.upper())
+    return full_id if full_id is not None else f"STD;{indicator_id}"
+
+
+@lru_cache(maxsize=256)
+def _output_mapping_for(indicator_id: str) -> dict[str, str]:
+    """Output mapping for a short name or full ID (INDICATOR_OUTPUTS is static)."""
+    return INDICATOR_OUTPUTS.get(_normalize_indicator_id(indicator_id), {})
+
+
+# Module-level LRU cache for indicator metadata (dict order = recency)
+_INDICATOR_CACHE_SIZE = 100
 _indicator_cache: dict[tuple[str, str, str, str], dict[str, Any]] = {}
 
 
@@ -144,17 +170,7 @@ class PineFacadeProvider(BaseProvider):
         Returns:
             Full TradingView indicator ID (e.g., "STD;RSI")
         """
-        # Check if it's a short name
-        upper_id = indicator_id.upper()
-        if upper_id in STANDARD_INDICATORS:
-            return STANDARD_INDICATORS[upper_id]
-
-        # Already full ID format
-        if ";" in indicator_id:
-            return indicator_id
-
-        # Try as standard indicator
-        return f"STD;{indicator_id}"
+        return _normalize_indicator_id(indicator_id)
 
     def _get_auth_cookies(
         self,
@@ -223,12 +239,14 @@ class PineFacadeProvider(BaseProvider):
         """
         # Check module-level cache
         cache_key = (indicator_id, version, session, signature)
-        if cache_key in _indicator_cache:
-            return _indicator_cache[cache_key]
+        cached = _indicator_cache.pop(cache_key, None)
+        if cached is not None:
+            # Re-insert to mark as most recently used
+            _indicator_cache[cache_key] = cached
+            return cached
 
         # Build URL - URL encode the indicator ID
-        import urllib.parse
-        encoded_id = urllib.parse.quote(indicator_id, safe="")
+        encoded_id = _ENCODED_IDS.get(indicator_id) or quote(indicator_id, safe="")
         url = f"{self.BASE_URL}/translate/{encoded_id}/{version}"
 
         # Build headers
@@ -267,9 +285,8 @@ class PineFacadeProvider(BaseProvider):
         # Parse and normalize the response
         result = self._parse_indicator_response(indicator_id, data)
 
-        # Store in module-level cache (limit size to 100)
-        if len(_indicator_cache) >= 100:
-            # Remove oldest entry (first key)
+        # Store in module-level cache, evicting the least recently used entry
+        if len(_indicator_cache) >= _INDICATOR_CACHE_SIZE:
             oldest_key = next(iter(_indicator_cache))
             del _indicator_cache[oldest_key]
         _indicator_cache[cache_key] = result
@@ -291,47 +308,52 @@ class PineFacadeProvider(BaseProvider):
         Returns:
             Normalized indicator metadata
         """
+        raw_inputs = data.get("inputs", [])
+        raw_plots = data.get("plots", [])
+        # (key, item) pairs for well-formed entries, in one pass each
+        inputs = [
+            (inp.get("name", f"in_{i}"), inp)
+            for i, inp in enumerate(raw_inputs if isinstance(raw_inputs, list) else ())
+            if isinstance(inp, dict)
+        ]
+        plots = [
+            (plot.get("id", f"plot_{i}"), plot)
+            for i, plot in enumerate(raw_plots if isinstance(raw_plots, list) else ())
+            if isinstance(plot, dict)
+        ]
+
         result = {
             "pineId": indicator_id,
             "pineVersion": data.get("version", "last"),
-            "inputs": {},
-            "plots": {},
-            "defaults": {},
+            "inputs": {
+                name: {
+                    "name": name,
+                    "type": inp.get("type", "integer"),
+                    "defval": inp.get("defval"),
+                    "min": inp.get("min"),
+                    "max": inp.get("max"),
+                    "options": inp.get("options"),
+                    "tooltip": inp.get("tooltip"),
+                }
+                for name, inp in inputs
+            },
+            "plots": {
+                plot_id: {
+                    "id": plot_id,
+                    "type": plot.get("type", "line"),
+                    "title": plot.get("title"),
+                }
+                for plot_id, plot in plots
+            },
+            "defaults": {
+                name: inp["defval"] for name, inp in inputs if inp.get("defval") is not None
+            },
         }
 
-        # Parse inputs
-        inputs = data.get("inputs", [])
-        if isinstance(inputs, list):
-            for i, inp in enumerate(inputs):
-                if isinstance(inp, dict):
-                    name = inp.get("name", f"in_{i}")
-                    result["inputs"][name] = {
-                        "name": name,
-                        "type": inp.get("type", "integer"),
-                        "defval": inp.get("defval"),
-                        "min": inp.get("min"),
-                        "max": inp.get("max"),
-                        "options": inp.get("options"),
-                        "tooltip": inp.get("tooltip"),
-                    }
-                    if inp.get("defval") is not None:
-                        result["defaults"][name] = inp["defval"]
-
-        # Parse plots (outputs)
-        plots = data.get("plots", [])
-        if isinstance(plots, list):
-            for i, plot in enumerate(plots):
-                if isinstance(plot, dict):
-                    plot_id = plot.get("id", f"plot_{i}")
-                    result["plots"][plot_id] = {
-                        "id": plot_id,
-                        "type": plot.get("type", "line"),
-                        "title": plot.get("title"),
-                    }
-
         # Add output field mappings if known
-        if indicator_id in INDICATOR_OUTPUTS:
-            result["output_mapping"] = INDICATOR_OUTPUTS[indicator_id]
+        output_mapping = INDICATOR_OUTPUTS.get(indicator_id)
+        if output_mapping is not None:
+            result["output_mapping"] = output_mapping
 
         return result
 
@@ -345,8 +367,7 @@ class PineFacadeProvider(BaseProvider):
         Returns:
             Dict mapping plot_N to friendly names
         """
-        normalized = self._normalize_indicator_id(indicator_id)
-        return INDICATOR_OUTPUTS.get(normalized, {})
+        return _output_mapping_for(indicator_id)
 
 
 def clear_indicator_cache() -> None:
@@ -11,9 +11,13 @@ Examples:
 
 from __future__ import annotations
 
+import operator
 import re
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -25,6 +29,195 @@ except ImportError:
 
 __all__ = ["TVScreenerProvider", "get_tv_screener_provider"]
 
+# Condition grammar, compiled once at import. Two-character operators come
+# before "<" / ">" so ">=" is never split into ">" and "=".
+_COMPARISON_RE = re.compile(r"^(\w+)\s*(>=|<=|>|<|==|!=)\s*(.+)$")
+_CROSSES_ABOVE_RE = re.compile(r"^(\w+)\s+crosses_above\s+(\w+)$")
+_CROSSES_BELOW_RE = re.compile(r"^(\w+)\s+crosses_below\s+(\w+)$")
+_CROSSES_RE = re.compile(r"^(\w+)\s+crosses\s+(\w+)$")
+_ABOVE_PCT_RE = re.compile(r"^(\w+)\s+above_pct\s+(\w+)\s+([\d.]+)$")
+_BELOW_PCT_RE = re.compile(r"^(\w+)\s+below_pct\s+(\w+)\s+([\d.]+)$")
+_DYNAMIC_FIELD_RE = re.compile(r"^(sma|ema|rsi)_(\d+)$")
+_OPERATOR_RE = re.compile(r"(>=|<=|>|<|==|!=)")
+_AND_RE = re.compile(r"\s+and\s+")
+_KEYWORD_RE = re.compile(r"\b(and|or|crosses_above|crosses_below|crosses|above_pct|below_pct)\b")
+
+
+_SUPERTREND_COLUMNS = [
+    "Supertrend",
+    "Supertrend_Direction",
+    "Supertrend_Upper",
+    "Supertrend_Lower",
+]
+# Indicator names local conditions use for those columns, in the same order
+_SUPERTREND_KEYS = [
+    "supertrend",
+    "supertrend_direction",
+    "supertrend_upper",
+    "supertrend_lower",
+]
+
+# Upper bound on the per-condition caches kept by the provider singleton,
+# matching the memoized condition parsers below
+_CONDITION_CACHE_SIZE = 256
+
+_NUMBER_SUFFIXES = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+
+
+def _parse_number(value: str) -> float:
+    """Parse number string, handling K/M/B suffixes (raises ValueError)."""
+    value = value.strip().upper()
+
+    for suffix, mult in _NUMBER_SUFFIXES.items():
+        if value.endswith(suffix):
+            return float(value[:-1]) * mult
+
+    return float(value)
+
+
+# Screeners apply the same few condition strings to every symbol, so the
+# string-level parsing below is memoized on the condition text.
+
+
+@lru_cache(maxsize=256)
+def _split_comparison(condition: str) -> tuple[str, str, str] | None:
+    """Split "field op value" into (field, op, value), or None if not a comparison."""
+    match = _COMPARISON_RE.match(condition.strip().lower())
+    if not match:
+        return None
+    return match.group(1).strip(), match.group(2).strip(), match.group(3).strip()
+
+
+_OPERATORS: dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+@lru_cache(maxsize=256)
+def _split_and_chain(condition: str) -> tuple[str, ...]:
+    """Split "a and b and c" into its clauses; a lone comparison is a 1-tuple."""
+    return tuple(part for part in _AND_RE.split(condition.strip().lower()) if part)
+
+
+def _batch_column(df: pd.DataFrame, field: str) -> np.ndarray:
+    """Numeric column for a field; missing columns and non-numeric values are NaN."""
+    if field not in df.columns:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[field], errors="coerce").to_numpy(dtype=np.float64)
+
+
+@lru_cache(maxsize=256)
+def _compile_local_condition_batch(condition: str) -> Callable[[pd.DataFrame], np.ndarray]:
+    """Compile a local condition into a mask function over an indicator frame.
+
+    Lone comparisons compile straight to their comparison; a flat "a and b"
+    chain ANDs the clause masks.
+    """
+    clauses = _split_and_chain(condition)
+    if len(clauses) == 1:
+        return _compile_comparison_batch(clauses[0])
+
+    checks = tuple(_compile_comparison_batch(clause) for clause in clauses)
+
+    def check_all(df: pd.DataFrame) -> np.ndarray:
+        mask = checks[0](df)
+        for check in checks[1:]:
+            mask &= check(df)
+        return mask
+
+    return check_all
+
+
+@lru_cache(maxsize=256)
+def _compile_comparison_batch(condition: str) -> Callable[[pd.DataFrame], np.ndarray]:
+    """Compile a "field op value" condition into a mask over an indicator frame.
+
+    The frame has one row per symbol and one column per indicator. The whole
+    condition is evaluated as a single NumPy comparison, so the result is a
+    boolean array aligned with the rows. Unparseable conditions pass every
+    row, and missing or non-numeric values fail.
+    """
+    parts = _split_comparison(condition)
+    if parts is None:
+        return lambda df: np.ones(len(df), dtype=bool)  # Skip unparseable conditions
+
+    field, op_str, right_str = parts
+    op_func = _OPERATORS[op_str]
+
+    # Missing and non-numeric values are NaN here, and ordered/equality
+    # comparisons against NaN are already False under IEEE 754; only "!="
+    # needs an explicit NaN mask
+    needs_nan_mask = op_str == "!="
+
+    try:
+        right_num = _parse_number(right_str)
+    except ValueError:
+        right_field = right_str
+
+        def check_fields(df: pd.DataFrame) -> np.ndarray:
+            left = _batch_column(df, field)
+            right = _batch_column(df, right_field)
+            result = op_func(left, right)
+            if needs_nan_mask:
+                result &= ~(np.isnan(left) | np.isnan(right))
+            return result
+
+        return check_fields
+
+    def check_value(df: pd.DataFrame) -> np.ndarray:
+        left = _batch_column(df, field)
+        result = op_func(left, right_num)
+        if needs_nan_mask:
+            result &= ~np.isnan(left)
+        return result
+
+    return check_value
+
+
+# Rough fraction of symbols passing a comparison, by operator: an equality
+# keeps few rows and an inequality keeps most. Used only to order AND-ed
+# local conditions so the mask empties as early as possible.
+_PASS_FRACTION = {"==": 0.1, ">": 0.5, "<": 0.5, ">=": 0.5, "<=": 0.5, "!=": 0.9}
+
+
+@lru_cache(maxsize=256)
+def _estimated_pass_fraction(condition: str) -> float:
+    """Estimated fraction of symbols a condition keeps (1.0 if unparseable)."""
+    fraction = 1.0
+    for clause in _split_and_chain(condition):
+        parts = _split_comparison(clause)
+        if parts is not None:  # Unparseable clauses pass every symbol
+            fraction *= _PASS_FRACTION[parts[1]]
+    return fraction
+
+
+@lru_cache(maxsize=256)
+def _extract_fields(condition: str) -> tuple[str, ...]:
+    """Field names referenced by a condition, in order of appearance."""
+    # Remove operators and keywords from condition
+    condition = _OPERATOR_RE.sub(" ", condition.lower())
+    # Remove logical operators and special operation keywords
+    condition = _KEYWORD_RE.sub(" ", condition)
+
+    fields = []
+    for token in condition.split():
+        # Skip if it's a pure number
+        try:
+            _parse_number(token)
+            continue
+        except ValueError:
+            pass
+
+        # It's a field name
+        fields.append(token)
+
+    return tuple(fields)
+
 
 # Singleton instance
 _provider: TVScreenerProvider | None = None
@@ -192,7 +385,12 @@ class TVScreenerProvider:
 
     def __init__(self) -> None:
         """Initialize the provider."""
-        pass
+        # Per-condition analysis, shared across scans by the singleton:
+        # (condition, interval) -> TradingView base columns it reads, and
+        # condition -> whether it needs local calculation. Both are capped at
+        # _CONDITION_CACHE_SIZE entries, evicting the oldest first.
+        self._condition_columns: dict[tuple[str, str], tuple[str, ...]] = {}
+        self._condition_is_local: dict[str, bool] = {}
 
     def _get_auth_cookies(self) -> dict[str, str] | None:
         """Get TradingView auth cookies if available.
@@ -396,16 +594,12 @@ class TVScreenerProvider:
             return self._parse_pct_condition(condition, interval)
 
         # Standard comparison: field op value/field
-        # Pattern: field operator value
-        pattern = r"^(\w+)\s*(>=|<=|>|<|==|!=)\s*(.+)$"
-        match = re.match(pattern, condition)
+        parts = _split_comparison(condition)
 
-        if not match:
+        if parts is None:
             return None
 
-        left_field = match.group(1).strip()
-        operator = match.group(2).strip()
-        right_value = match.group(3).strip()
+        left_field, operator, right_value = parts
 
         # Get TradingView column name for left field
         tv_left = self._get_tv_column(left_field, interval)
@@ -465,7 +659,7 @@ class TVScreenerProvider:
         condition = condition.strip().lower()
 
         # Pattern: field1 crosses_above field2
-        crosses_above_match = re.match(r"^(\w+)\s+crosses_above\s+(\w+)$", condition)
+        crosses_above_match = _CROSSES_ABOVE_RE.match(condition)
         if crosses_above_match:
             left_field = crosses_above_match.group(1)
             right_field = crosses_above_match.group(2)
@@ -474,7 +668,7 @@ class TVScreenerProvider:
             return col(tv_left).crosses_above(col(tv_right))
 
         # Pattern: field1 crosses_below field2
-        crosses_below_match = re.match(r"^(\w+)\s+crosses_below\s+(\w+)$", condition)
+        crosses_below_match = _CROSSES_BELOW_RE.match(condition)
         if crosses_below_match:
             left_field = crosses_below_match.group(1)
             right_field = crosses_below_match.group(2)
@@ -483,7 +677,7 @@ class TVScreenerProvider:
             return col(tv_left).crosses_below(col(tv_right))
 
         # Pattern: field1 crosses field2 (any direction)
-        crosses_match = re.match(r"^(\w+)\s+crosses\s+(\w+)$", condition)
+        crosses_match = _CROSSES_RE.match(condition)
         if crosses_match:
             left_field = crosses_match.group(1)
             right_field = crosses_match.group(2)
@@ -508,7 +702,7 @@ class TVScreenerProvider:
         condition = condition.strip().lower()
 
         # Pattern: field1 above_pct field2 value
-        above_pct_match = re.match(r"^(\w+)\s+above_pct\s+(\w+)\s+([\d.]+)$", condition)
+        above_pct_match = _ABOVE_PCT_RE.match(condition)
         if above_pct_match:
             left_field = above_pct_match.group(1)
             right_field = above_pct_match.group(2)
@@ -518,7 +712,7 @@ class TVScreenerProvider:
             return col(tv_left).above_pct(tv_right, pct_value)
 
         # Pattern: field1 below_pct field2 value
-        below_pct_match = re.match(r"^(\w+)\s+below_pct\s+(\w+)\s+([\d.]+)$", condition)
+        below_pct_match = _BELOW_PCT_RE.match(condition)
         if below_pct_match:
             left_field = below_pct_match.group(1)
             right_field = below_pct_match.group(2)
@@ -547,23 +741,16 @@ class TVScreenerProvider:
         else:
             # Try pattern matching for dynamic indicators
             # sma_N, ema_N, rsi_N patterns
-            sma_match = re.match(r"^sma_(\d+)$", field)
-            if sma_match:
-                period = sma_match.group(1)
-                tv_col = f"SMA{period}"
-            else:
-                ema_match = re.match(r"^ema_(\d+)$", field)
-                if ema_match:
-                    period = ema_match.group(1)
-                    tv_col = f"EMA{period}"
+            dynamic_match = _DYNAMIC_FIELD_RE.match(field)
+            if dynamic_match:
+                kind, period = dynamic_match.groups()
+                if kind == "rsi" and period == "14":
+                    tv_col = "RSI"
                 else:
-                    rsi_match = re.match(r"^rsi_(\d+)$", field)
-                    if rsi_match:
-                        period = rsi_match.group(1)
-                        tv_col = f"RSI{period}" if period != "14" else "RSI"
-                    else:
-                        # Use as-is (TradingView may accept it)
-                        tv_col = field
+                    tv_col = f"{kind.upper()}{period}"
+            else:
+                # Use as-is (TradingView may accept it)
+                tv_col = field
 
         # Apply interval suffix for non-daily timeframes
         suffix = self.INTERVAL_MAP.get(interval, "")
@@ -584,15 +771,7 @@ class TVScreenerProvider:
         Raises:
             ValueError: If not a valid number
         """
-        value = value.strip().upper()
-
-        multipliers = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
-
-        for suffix, mult in multipliers.items():
-            if value.endswith(suffix):
-                return float(value[:-1]) * mult
-
-        return float(value)
+        return _parse_number(value)
 
     def _get_select_columns(
         self,
@@ -614,12 +793,7 @@ class TVScreenerProvider:
 
         # Extract fields from conditions
         for cond in conditions:
-            fields = self._extract_fields_from_condition(cond)
-            for field in fields:
-                tv_col = self._get_tv_column(field, interval)
-                # Remove interval suffix for selection (select base columns)
-                base_col = tv_col.split("|")[0].rstrip("[1]")
-                columns.add(base_col)
+            columns.update(self._get_condition_columns(cond, interval))
 
         # Add extra columns
         if extra_columns:
@@ -630,6 +804,30 @@ class TVScreenerProvider:
 
         return list(columns)
 
+    def _get_condition_columns(self, condition: str, interval: str) -> tuple[str, ...]:
+        """Get the TradingView base columns a condition reads (cached).
+
+        Args:
+            condition: Condition string
+            interval: Timeframe
+
+        Returns:
+            Tuple of TradingView column names without interval suffix
+        """
+        key = (condition, interval)
+        cached = self._condition_columns.get(key)
+        if cached is None:
+            base_cols = []
+            for field in _extract_fields(condition):
+                tv_col = self._get_tv_column(field, interval)
+                # Remove interval suffix for selection (select base columns)
+                base_cols.append(tv_col.split("|")[0].rstrip("[1]"))
+            cached = tuple(base_cols)
+            if len(self._condition_columns) >= _CONDITION_CACHE_SIZE:
+                del self._condition_columns[next(iter(self._condition_columns))]
+            self._condition_columns[key] = cached
+        return cached
+
     def _extract_fields_from_condition(self, condition: str) -> list[str]:
         """Extract field names from a condition string.
 
@@ -639,36 +837,7 @@ class TVScreenerProvider:
         Returns:
             List of field names
         """
-        fields = []
-
-        # Remove operators and keywords from condition
-        condition = condition.lower()
-        condition = re.sub(r"(>=|<=|>|<|==|!=)", " ", condition)
-        # Remove logical operators and special operation keywords
-        condition = re.sub(
-            r"\b(and|or|crosses_above|crosses_below|crosses|above_pct|below_pct)\b",
-            " ",
-            condition,
-        )
-
-        tokens = condition.split()
-
-        for token in tokens:
-            token = token.strip()
-            if not token:
-                continue
-
-            # Skip if it's a pure number
-            try:
-                self._parse_number(token)
-                continue
-            except ValueError:
-                pass
-
-            # It's a field name
-            fields.append(token)
-
-        return fields
+        return list(_extract_fields(condition))
 
     def _normalize_columns(self, df: pd.DataFrame, interval: str) -> pd.DataFrame:
         """Normalize TradingView column names to borsapy format.
@@ -743,8 +912,12 @@ class TVScreenerProvider:
         local_conditions = []
 
         for cond in conditions:
-            fields = self._extract_fields_from_condition(cond)
-            needs_local = any(self._requires_local_calc(f) for f in fields)
+            needs_local = self._condition_is_local.get(cond)
+            if needs_local is None:
+                needs_local = any(self._requires_local_calc(f) for f in _extract_fields(cond))
+                if len(self._condition_is_local) >= _CONDITION_CACHE_SIZE:
+                    del self._condition_is_local[next(iter(self._condition_is_local))]
+                self._condition_is_local[cond] = needs_local
 
             if needs_local:
                 local_conditions.append(cond)
@@ -779,10 +952,10 @@ class TVScreenerProvider:
             return pd.DataFrame()
 
         def _process_symbol(symbol: str) -> dict[str, Any] | None:
-            """Fetch history, compute local indicators, and filter one symbol.
+            """Fetch history and compute local indicators for one symbol.
 
-            Returns the matching result row, or None if the symbol does not
-            match, has insufficient data, or fails to fetch.
+            Returns the result row, or None if the symbol has insufficient
+            data or fails to fetch.
             """
             try:
                 # Fetch historical data
@@ -797,31 +970,29 @@ class TVScreenerProvider:
                 # Calculate local indicators
                 indicators: dict[str, Any] = {}
 
+                # Only the latest bar is needed, so read it from the raw
+                # arrays instead of going through pandas .iloc per value
+
                 # Supertrend
                 st_df = calculate_supertrend(df)
                 if not st_df.empty:
-                    indicators["supertrend"] = st_df["Supertrend"].iloc[-1]
-                    indicators["supertrend_direction"] = st_df[
-                        "Supertrend_Direction"
-                    ].iloc[-1]
-                    indicators["supertrend_upper"] = st_df["Supertrend_Upper"].iloc[-1]
-                    indicators["supertrend_lower"] = st_df["Supertrend_Lower"].iloc[-1]
+                    # One array per column, so each keeps its own dtype (a
+                    # multi-column to_numpy() would upcast the int direction)
+                    for key, column in zip(_SUPERTREND_KEYS, _SUPERTREND_COLUMNS, strict=True):
+                        indicators[key] = st_df[column].to_numpy()[-1]
 
                 # Tilson T3
                 t3_series = calculate_tilson_t3(df)
                 if not t3_series.empty:
-                    indicators["t3"] = t3_series.iloc[-1]
-                    indicators["tilson_t3"] = t3_series.iloc[-1]
-                    indicators["t3_5"] = t3_series.iloc[-1]
+                    t3_last = t3_series.to_numpy()[-1]
+                    indicators["t3"] = t3_last
+                    indicators["tilson_t3"] = t3_last
+                    indicators["t3_5"] = t3_last
 
                 # Add price data
-                indicators["close"] = df["Close"].iloc[-1]
-                indicators["price"] = df["Close"].iloc[-1]
-
-                # Check all conditions
-                for cond in conditions:
-                    if not self._evaluate_local_condition(cond, indicators):
-                        return None
+                close_last = df["Close"].to_numpy()[-1]
+                indicators["close"] = close_last
+                indicators["price"] = close_last
 
                 result_row = {"symbol": symbol}
                 result_row.update(indicators)
@@ -843,63 +1014,15 @@ class TVScreenerProvider:
         if not results:
             return pd.DataFrame()
 
-        return pd.DataFrame(results)
-
-    def _evaluate_local_condition(
-        self, condition: str, indicators: dict[str, Any]
-    ) -> bool:
-        """Evaluate a condition against calculated indicators.
-
-        Args:
-            condition: Condition string like "supertrend_direction == 1"
-            indicators: Dictionary of indicator values
-
-        Returns:
-            True if condition is satisfied
-        """
-        import operator
-
-        condition = condition.strip().lower()
-
-        # Parse condition: field op value
-        pattern = r"^(\w+)\s*(>=|<=|>|<|==|!=)\s*(.+)$"
-        match = re.match(pattern, condition)
-
-        if not match:
-            return True  # Skip unparseable conditions
-
-        field = match.group(1).strip()
-        op_str = match.group(2).strip()
-        right_str = match.group(3).strip()
-
-        # Get left value
-        left_val = indicators.get(field)
-        if left_val is None:
-            return False
-
-        # Get right value (number or another field)
-        try:
-            right_val = self._parse_number(right_str)
-        except ValueError:
-            right_val = indicators.get(right_str)
-            if right_val is None:
-                return False
-
-        # Apply operator
-        ops = {
-            ">": operator.gt,
-            "<": operator.lt,
-            ">=": operator.ge,
-            "<=": operator.le,
-            "==": operator.eq,
-            "!=": operator.ne,
-        }
-
-        op_func = ops.get(op_str)
-        if op_func is None:
-            return True
-
-        try:
-            return op_func(float(left_val), float(right_val))
-        except (ValueError, TypeError):
-            return False
+        # Filter all symbols at once: each condition is one vectorized
+        # comparison over the indicator columns instead of a call per symbol.
+        # The most selective conditions run first and filtering stops as soon
+        # as no symbol is left.
+        df = pd.DataFrame(results)
+        mask = np.ones(len(df), dtype=bool)
+        for cond in sorted(conditions, key=_estimated_pass_fraction):
+            mask &= _compile_local_condition_batch(cond)(df)
+            if not mask.any():
+                return pd.DataFrame()
+
+        return df[mask].reset_index(drop=True)
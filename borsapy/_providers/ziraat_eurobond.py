@@ -20,6 +20,12 @@ ZIRAAT_URL = "https://www.ziraatbank.com.tr/tr/_layouts/15/Ziraat/FaizOranlari/A
 class ZiraatEurobondProvider(BaseProvider):
     """Provider for Eurobond data from Ziraat Bank."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # ISIN -> bond dict, rebuilt whenever get_eurobonds() returns a new list
+        self._isin_index: dict[str, dict] = {}
+        self._isin_index_source: list[dict] | None = None
+
     def _parse_turkish_number(self, text: str) -> float | None:
         """Parse Turkish number format (comma as decimal separator).
 
@@ -186,14 +192,13 @@ class ZiraatEurobondProvider(BaseProvider):
         Returns:
             Eurobond dict or None if not found.
         """
-        isin = isin.upper()
         bonds = self.get_eurobonds()
+        if bonds is not self._isin_index_source:
+            # Reversed so the first bond wins for duplicate ISINs
+            self._isin_index = {bond["isin"]: bond for bond in reversed(bonds)}
+            self._isin_index_source = bonds
 
-        for bond in bonds:
-            if bond["isin"] == isin:
-                return bond
-
-        return None
+        return self._isin_index.get(isin.upper())
 
     def _fetch_bonds_for_date_cached(self, date_str: str) -> list[dict]:
         """Cached wrapper around :meth:`_fetch_bonds_for_date`.
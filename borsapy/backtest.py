@@ -29,15 +29,25 @@ Examples:
 
 from __future__ import annotations
 
+import logging
+import multiprocessing
+import os
+import pickle
+import sys
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Literal
 
 import numpy as np
 import pandas as pd
 
-__all__ = ["Trade", "BacktestResult", "Backtest", "backtest"]
+__all__ = ["Trade", "BacktestResult", "Backtest", "backtest", "backtest_many"]
+
+logger = logging.getLogger(__name__)
 
 
 # Strategy signal types
@@ -47,6 +57,9 @@ Position = Literal["long", "short"] | None
 # Strategy function signature
 StrategyFunc = Callable[[dict, Position, dict], Signal]
 
+# Vectorized strategy signature: DataFrame (OHLCV + indicators) -> 1 (BUY), -1 (SELL), 0 (HOLD)
+VectorStrategyFunc = Callable[[pd.DataFrame], "pd.Series | np.ndarray"]
+
 
 @dataclass
 class Trade:
@@ -142,6 +155,9 @@ class BacktestResult:
         equity_curve: Daily equity values.
         drawdown_curve: Daily drawdown values.
         buy_hold_curve: Buy & hold comparison values.
+
+    Trade statistics are computed on first access and cached, so the trade
+    list should not be modified after the result is created.
     """
 
     # Identification
@@ -181,20 +197,46 @@ class BacktestResult:
             return 0.0
         return (self.net_profit / self.initial_capital) * 100
 
+    # === Trade Statistics ===
+
+    @cached_property
+    def _closed_profits(self) -> np.ndarray:
+        """Profits of closed trades, in trade order."""
+        return np.fromiter(
+            (t.profit for t in self.trades if t.is_closed), dtype=np.float64
+        )
+
+    @cached_property
+    def _trade_stats(self) -> dict[str, float]:
+        """Aggregate trade statistics, computed once from closed-trade profits."""
+        profits = self._closed_profits
+        winners = profits[profits > 0]
+        losers = profits[profits < 0]
+        return {
+            "total": int(profits.size),
+            "winning": int(winners.size),
+            "losing": int(profits.size - winners.size),
+            "gross_profit": float(winners.sum()),
+            "gross_loss": float(-losers.sum()),
+            "avg_trade": float(profits.mean()) if profits.size else 0.0,
+            "avg_winning": float(winners.mean()) if winners.size else 0.0,
+            "avg_losing": float(losers.mean()) if losers.size else 0.0,
+        }
+
     @property
     def total_trades(self) -> int:
         """Total number of closed trades."""
-        return len([t for t in self.trades if t.is_closed])
+        return self._trade_stats["total"]
 
     @property
     def winning_trades(self) -> int:
         """Number of profitable trades."""
-        return len([t for t in self.trades if t.is_closed and (t.profit or 0) > 0])
+        return self._trade_stats["winning"]
 
     @property
     def losing_trades(self) -> int:
         """Number of losing trades."""
-        return len([t for t in self.trades if t.is_closed and (t.profit or 0) <= 0])
+        return self._trade_stats["losing"]
 
     @property
     def win_rate(self) -> float:
@@ -206,8 +248,8 @@ class BacktestResult:
     @property
     def profit_factor(self) -> float:
         """Ratio of gross profits to gross losses."""
-        gross_profit = sum(t.profit or 0 for t in self.trades if t.is_closed and (t.profit or 0) > 0)
-        gross_loss = abs(sum(t.profit or 0 for t in self.trades if t.is_closed and (t.profit or 0) < 0))
+        gross_profit = self._trade_stats["gross_profit"]
+        gross_loss = self._trade_stats["gross_loss"]
         if gross_loss == 0:
             return float("inf") if gross_profit > 0 else 0.0
         return gross_profit / gross_loss
@@ -215,51 +257,38 @@ class BacktestResult:
     @property
     def avg_trade(self) -> float:
         """Average profit per trade."""
-        closed = [t for t in self.trades if t.is_closed]
-        if not closed:
-            return 0.0
-        return sum(t.profit or 0 for t in closed) / len(closed)
+        return self._trade_stats["avg_trade"]
 
     @property
     def avg_winning_trade(self) -> float:
         """Average profit of winning trades."""
-        winners = [t for t in self.trades if t.is_closed and (t.profit or 0) > 0]
-        if not winners:
-            return 0.0
-        return sum(t.profit or 0 for t in winners) / len(winners)
+        return self._trade_stats["avg_winning"]
 
     @property
     def avg_losing_trade(self) -> float:
         """Average loss of losing trades."""
-        losers = [t for t in self.trades if t.is_closed and (t.profit or 0) < 0]
-        if not losers:
-            return 0.0
-        return sum(t.profit or 0 for t in losers) / len(losers)
+        return self._trade_stats["avg_losing"]
 
     @property
     def max_consecutive_wins(self) -> int:
         """Maximum consecutive winning trades."""
-        return self._max_consecutive(lambda t: (t.profit or 0) > 0)
+        return self._max_consecutive(self._closed_profits > 0)
 
     @property
     def max_consecutive_losses(self) -> int:
         """Maximum consecutive losing trades."""
-        return self._max_consecutive(lambda t: (t.profit or 0) <= 0)
+        return self._max_consecutive(self._closed_profits <= 0)
 
-    def _max_consecutive(self, condition: Callable[[Trade], bool]) -> int:
-        """Helper to find max consecutive trades matching condition."""
-        closed = [t for t in self.trades if t.is_closed]
-        if not closed:
+    @staticmethod
+    def _max_consecutive(mask: np.ndarray) -> int:
+        """Helper to find the longest run of True values in a boolean mask."""
+        if not mask.any():
             return 0
-        max_count = 0
-        current_count = 0
-        for trade in closed:
-            if condition(trade):
-                current_count += 1
-                max_count = max(max_count, current_count)
-            else:
-                current_count = 0
-        return max_count
+        # Run boundaries are where the zero-padded mask flips 0->1 / 1->0
+        edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return int((ends - starts).max())
 
     @property
     def sharpe_ratio(self) -> float:
@@ -394,7 +423,47 @@ class BacktestResult:
                     "duration",
                 ]
             )
-        return pd.DataFrame([t.to_dict() for t in self.trades])
+
+        # Build column by column; derived fields are computed on whole arrays
+        # instead of calling Trade.to_dict() per trade
+        trades = self.trades
+        entry_price = np.array([t.entry_price for t in trades], dtype=np.float64)
+        exit_price = np.array(
+            [np.nan if t.exit_price is None else t.exit_price for t in trades],
+            dtype=np.float64,
+        )
+        shares = np.array([t.shares for t in trades], dtype=np.float64)
+        commission = np.array([t.commission for t in trades], dtype=np.float64)
+        is_long = np.array([t.side == "long" for t in trades])
+        is_closed = np.array([t.is_closed for t in trades])
+
+        df = pd.DataFrame(
+            {
+                "entry_time": [t.entry_time for t in trades],
+                "entry_price": entry_price,
+                "exit_time": [t.exit_time for t in trades],
+                "exit_price": exit_price,
+                "side": [t.side for t in trades],
+                "shares": shares,
+                "commission": commission,
+            }
+        )
+
+        gross = np.where(is_long, exit_price - entry_price, entry_price - exit_price) * shares
+        profit = np.where(is_closed, gross - commission, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            profit_pct = profit / (entry_price * shares) * 100
+        profit_pct[entry_price == 0] = np.nan
+
+        duration = (
+            pd.to_datetime(df["exit_time"]) - pd.to_datetime(df["entry_time"])
+        ).dt.total_seconds() / 86400
+        duration[~is_closed] = np.nan
+
+        df["profit"] = profit
+        df["profit_pct"] = profit_pct
+        df["duration"] = duration
+        return df
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -508,6 +577,12 @@ class Backtest:
         >>> bt = Backtest("THYAO", my_strategy, period="1y")
         >>> result = bt.run()
         >>> print(result.sharpe_ratio)
+
+        >>> def rsi_signals(df):
+        ...     return np.where(df['rsi'] < 30, 1, np.where(df['rsi'] > 70, -1, 0))
+
+        >>> bt = Backtest("THYAO", rsi_signals, indicators=['rsi'], vectorized=True)
+        >>> result = bt.run()
     """
 
     # Indicator period warmup
@@ -516,13 +591,14 @@ class Backtest:
     def __init__(
         self,
         symbol: str,
-        strategy: StrategyFunc,
+        strategy: StrategyFunc | VectorStrategyFunc,
         period: str = "1y",
         interval: str = "1d",
         capital: float = 100_000.0,
         commission: float = 0.001,
         indicators: list[str] | None = None,
         slippage: float = 0.0,  # Future use
+        vectorized: bool = False,
     ):
         """
         Initialize Backtest.
@@ -540,6 +616,11 @@ class Backtest:
                        'ema_12', 'ema_26', 'ema_50', 'macd', 'bollinger',
                        'atr', 'atr_20', 'stochastic', 'adx'
             slippage: Slippage per trade (for future use).
+            vectorized: If True, strategy is called once with the full
+                        DataFrame (OHLCV + indicator columns) and must return
+                        one signal per bar: 1 (BUY), -1 (SELL) or 0 (HOLD).
+                        Only suitable for strategies that do not depend on
+                        the current position.
         """
         self.symbol = symbol.upper()
         self.strategy = strategy
@@ -549,6 +630,7 @@ class Backtest:
         self.commission = commission
         self.indicators = indicators or ["rsi", "sma_20", "ema_12", "macd"]
         self.slippage = slippage
+        self.vectorized = vectorized
 
         # Strategy name for reporting
         self._strategy_name = getattr(strategy, "__name__", "custom_strategy")
@@ -556,6 +638,11 @@ class Backtest:
         # Data storage
         self._df: pd.DataFrame | None = None
         self._df_with_indicators: pd.DataFrame | None = None
+        self._indicator_columns: list[str] = []
+        self._indicator_values: np.ndarray | None = None
+        self._ohlc_values: np.ndarray | None = None
+        self._volume_values: np.ndarray | None = None
+        self._timestamps: list[Any] = []
 
     def _load_data(self) -> pd.DataFrame:
         """Load historical data from Ticker."""
@@ -649,59 +736,85 @@ class Backtest:
 
         return result
 
+    def _build_indicator_table(self) -> None:
+        """Extract indicator columns into one float array for per-bar lookups."""
+        df = self._df_with_indicators
+        if df is None:
+            self._indicator_columns = []
+            self._indicator_values = np.empty((0, 0))
+            return
+
+        # All non-OHLCV columns are indicators
+        exclude_cols = {"Open", "High", "Low", "Close", "Volume", "Adj Close"}
+        self._indicator_columns = [c for c in df.columns if c not in exclude_cols]
+        self._indicator_values = df[self._indicator_columns].to_numpy(dtype=np.float64)
+
     def _get_indicators_at(self, idx: int) -> dict[str, float]:
         """Get indicator values at specific index."""
         if self._df_with_indicators is None:
             return {}
+        if self._indicator_values is None:
+            self._build_indicator_table()
+        assert self._indicator_values is not None
 
-        row = self._df_with_indicators.iloc[idx]
-        indicators = {}
-
-        # Extract all non-OHLCV columns as indicators
-        exclude_cols = {"Open", "High", "Low", "Close", "Volume", "Adj Close"}
-
-        for col in self._df_with_indicators.columns:
-            if col not in exclude_cols:
-                val = row[col]
-                if pd.notna(val):
-                    indicators[col] = float(val)
+        # NaN (warmup) values are left out, NaN != NaN
+        return {
+            col: float(val)
+            for col, val in zip(self._indicator_columns, self._indicator_values[idx], strict=True)
+            if val == val
+        }
 
-        return indicators
+    def _build_candle_table(self) -> None:
+        """Extract OHLCV columns and timestamps once for per-bar lookups."""
+        df = self._df
+        if df is None:
+            self._ohlc_values = np.empty((0, 4))
+            self._volume_values = None
+            self._timestamps = []
+            return
+
+        self._ohlc_values = df[["Open", "High", "Low", "Close"]].to_numpy(dtype=np.float64)
+        self._volume_values = (
+            df["Volume"].to_numpy(dtype=np.float64) if "Volume" in df.columns else None
+        )
+        index = df.index
+        self._timestamps = (
+            list(index.to_pydatetime()) if isinstance(index, pd.DatetimeIndex) else list(index)
+        )
 
     def _build_candle(self, idx: int) -> dict[str, Any]:
         """Build candle dict from DataFrame row."""
         if self._df is None:
             return {}
+        if self._ohlc_values is None:
+            self._build_candle_table()
+        assert self._ohlc_values is not None
 
-        row = self._df.iloc[idx]
-        timestamp = self._df.index[idx]
-
+        open_, high, low, close = self._ohlc_values[idx]
+        timestamp = self._timestamps[idx]
         if isinstance(timestamp, pd.Timestamp):
             timestamp = timestamp.to_pydatetime()
 
         return {
             "timestamp": timestamp,
-            "open": float(row["Open"]),
-            "high": float(row["High"]),
-            "low": float(row["Low"]),
-            "close": float(row["Close"]),
-            "volume": float(row.get("Volume", 0)) if "Volume" in row else 0,
+            "open": float(open_),
+            "high": float(high),
+            "low": float(low),
+            "close": float(close),
+            "volume": float(self._volume_values[idx]) if self._volume_values is not None else 0,
             "_index": idx,
         }
 
-    def run(self) -> BacktestResult:
-        """
-        Run the backtest.
-
-        Returns:
-            BacktestResult with all performance metrics.
+    def _last_timestamp(self) -> Any:
+        """Timestamp of the final bar, as used for closing open positions."""
+        timestamp = self._timestamps[-1]
+        if isinstance(timestamp, pd.Timestamp):
+            timestamp = timestamp.to_pydatetime()
+        return timestamp
 
-        Raises:
-            ValueError: If no data available for symbol.
-        """
-        # Load data
-        self._df = self._load_data()
-        self._df_with_indicators = self._calculate_indicators(self._df)
+    def _simulate(self) -> tuple[list[Trade], list[float]]:
+        """Run the strategy callback bar by bar."""
+        assert self._df is not None
 
         # Initialize state
         cash = self.capital
@@ -711,12 +824,7 @@ class Backtest:
         current_trade: Trade | None = None
 
         # Track equity curve
-        equity_values = []
-        dates = []
-
-        # Buy & hold tracking
-        initial_price = self._df["Close"].iloc[self.WARMUP_PERIOD]
-        bh_shares = self.capital / initial_price
+        equity_values: list[float] = []
 
         # Run simulation
         for idx in range(self.WARMUP_PERIOD, len(self._df)):
@@ -772,7 +880,6 @@ class Backtest:
                 equity = cash
 
             equity_values.append(equity)
-            dates.append(timestamp)
 
         # Close any open position at end
         if position == "long" and current_trade is not None:
@@ -780,14 +887,110 @@ class Backtest:
             exit_value = shares * final_price
             exit_commission = exit_value * self.commission
 
-            current_trade.exit_time = self._df.index[-1]
-            if isinstance(current_trade.exit_time, pd.Timestamp):
-                current_trade.exit_time = current_trade.exit_time.to_pydatetime()
+            current_trade.exit_time = self._last_timestamp()
             current_trade.exit_price = final_price
             current_trade.commission += exit_commission
 
             trades.append(current_trade)
 
+        return trades, equity_values
+
+    def _simulate_vectorized(self) -> tuple[list[Trade], np.ndarray]:
+        """Run a vectorized strategy once over the whole DataFrame.
+
+        Signals are turned into a long/flat position mask with a forward fill
+        (BUY while long and SELL while flat are ignored, as in the bar loop),
+        so Python only iterates over trades, not bars.
+        """
+        assert self._df is not None and self._df_with_indicators is not None
+
+        signals = np.asarray(self.strategy(self._df_with_indicators), dtype=np.float64)
+        if signals.shape != (len(self._df),):
+            raise ValueError(
+                f"Vectorized strategy must return one signal per bar "
+                f"(expected {len(self._df)}, got {signals.shape})"
+            )
+
+        closes = self._ohlc_values[self.WARMUP_PERIOD:, 3]
+        timestamps = self._timestamps[self.WARMUP_PERIOD:]
+
+        # Last non-zero signal wins; bars before the first signal are flat
+        state = pd.Series(signals[self.WARMUP_PERIOD:]).replace(0, np.nan).ffill()
+        in_position = (state == 1).to_numpy()
+
+        edges = np.diff(np.concatenate(([0], in_position.view(np.int8))))
+        entries = np.flatnonzero(edges == 1)
+        exits = np.flatnonzero(edges == -1)
+
+        cash = self.capital
+        trades: list[Trade] = []
+        equity = np.empty(len(closes))
+        flat_from = 0
+
+        for i, entry in enumerate(entries):
+            equity[flat_from:entry] = cash
+
+            entry_price = float(closes[entry])
+            entry_commission = cash * self.commission
+            shares = (cash - entry_commission) / entry_price
+            trade = Trade(
+                entry_time=timestamps[entry],
+                entry_price=entry_price,
+                side="long",
+                shares=shares,
+                commission=entry_commission,
+            )
+
+            if i < len(exits):
+                exit_ = exits[i]
+                equity[entry:exit_] = shares * closes[entry:exit_]
+                exit_price = float(closes[exit_])
+                trade.exit_time = timestamps[exit_]
+            else:
+                # Close any open position at end
+                exit_ = len(closes)
+                equity[entry:] = shares * closes[entry:]
+                exit_price = float(self._df["Close"].iloc[-1])
+                trade.exit_time = self._last_timestamp()
+
+            exit_value = shares * exit_price
+            exit_commission = exit_value * self.commission
+            trade.exit_price = exit_price
+            trade.commission += exit_commission
+            trades.append(trade)
+
+            cash = exit_value - exit_commission
+            flat_from = exit_
+
+        equity[flat_from:] = cash
+        return trades, equity
+
+    def run(self) -> BacktestResult:
+        """
+        Run the backtest.
+
+        Returns:
+            BacktestResult with all performance metrics.
+
+        Raises:
+            ValueError: If no data available for symbol.
+        """
+        # Load data
+        self._df = self._load_data()
+        self._df_with_indicators = self._calculate_indicators(self._df)
+        self._build_candle_table()
+        self._build_indicator_table()
+
+        if self.vectorized:
+            trades, equity_values = self._simulate_vectorized()
+        else:
+            trades, equity_values = self._simulate()
+        dates = self._timestamps[self.WARMUP_PERIOD:]
+
+        # Buy & hold tracking
+        initial_price = self._df["Close"].iloc[self.WARMUP_PERIOD]
+        bh_shares = self.capital / initial_price
+
         # Build curves
         equity_curve = pd.Series(equity_values, index=pd.DatetimeIndex(dates))
 
@@ -815,12 +1018,13 @@ class Backtest:
 
 def backtest(
     symbol: str,
-    strategy: StrategyFunc,
+    strategy: StrategyFunc | VectorStrategyFunc,
     period: str = "1y",
     interval: str = "1d",
     capital: float = 100_000.0,
     commission: float = 0.001,
     indicators: list[str] | None = None,
+    vectorized: bool = False,
 ) -> BacktestResult:
     """
     Run a backtest with a single function call.
@@ -836,6 +1040,7 @@ def backtest(
         capital: Initial capital.
         commission: Commission rate.
         indicators: List of indicators to calculate.
+        vectorized: Treat strategy as a vectorized signal function (see Backtest).
 
     Returns:
         BacktestResult with all performance metrics.
@@ -860,5 +1065,121 @@ def backtest(
         capital=capital,
         commission=commission,
         indicators=indicators,
+        vectorized=vectorized,
     )
     return bt.run()
+
+
+def _run_backtest_job(kwargs: dict[str, Any]) -> BacktestResult | None:
+    """Run a single backtest in a worker (None on failure)."""
+    try:
+        return Backtest(**kwargs).run()
+    except Exception as e:
+        # Skip symbols that fail, but leave a trace of why
+        logger.warning(f"Backtest failed for {kwargs['symbol']}: {e}")
+        return None
+
+
+def _can_run_in_subprocess(strategy: Callable[..., Any]) -> bool:
+    """Whether worker processes can receive the strategy.
+
+    The strategy must pickle (lambdas and closures don't), and without fork
+    it is looked up by module in the worker, so it can't live in a
+    ``__main__`` that has no file (a notebook or interactive session).
+    """
+    try:
+        pickle.dumps(strategy)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+    if multiprocessing.get_start_method() != "fork":
+        if getattr(strategy, "__module__", None) == "__main__":
+            return hasattr(sys.modules["__main__"], "__file__")
+    return True
+
+
+def backtest_many(
+    symbols: list[str],
+    strategy: StrategyFunc | VectorStrategyFunc,
+    period: str = "1y",
+    interval: str = "1d",
+    capital: float = 100_000.0,
+    commission: float = 0.001,
+    indicators: list[str] | None = None,
+    vectorized: bool = False,
+    max_workers: int | None = None,
+) -> dict[str, BacktestResult]:
+    """
+    Run the same strategy over many symbols in parallel.
+
+    Each symbol is backtested in its own worker process, since the bar loop
+    is CPU-bound Python. Worker processes need a picklable strategy: a
+    top-level function in an importable module, not a lambda or closure.
+    On platforms that spawn workers (Windows, macOS), the calling script
+    must also guard its entry point with ``if __name__ == "__main__":``.
+    Strategies that can't be sent to a process (lambdas, closures, functions
+    defined in a notebook) run on a thread pool instead, which works but
+    does not run the bar loops in parallel.
+
+    Args:
+        symbols: Stock symbols to backtest.
+        strategy: Strategy function (see Backtest).
+        period: Historical data period.
+        interval: Data interval.
+        capital: Initial capital.
+        commission: Commission rate.
+        indicators: List of indicators to calculate.
+        vectorized: Treat strategy as a vectorized signal function (see Backtest).
+        max_workers: Worker count (default: CPU count). 1 runs in-process.
+
+    Returns:
+        Dict mapping upper-cased symbol to BacktestResult, in input order.
+        Duplicate symbols (case-insensitive) are backtested once.
+
+    Note:
+        A symbol whose backtest raises (e.g. no data for the period) is left
+        out of the result instead of aborting the other symbols; the error is
+        logged as a warning on the ``borsapy.backtest`` logger. Compare the
+        returned keys with the input to find the symbols that failed.
+
+    Examples:
+        >>> results = bp.backtest_many(["THYAO", "GARAN", "ASELS"], rsi_strategy)
+        >>> for symbol, result in results.items():
+        ...     print(symbol, f"{result.net_profit_pct:.2f}%")
+    """
+    jobs = [
+        {
+            "symbol": symbol,
+            "strategy": strategy,
+            "period": period,
+            "interval": interval,
+            "capital": capital,
+            "commission": commission,
+            "indicators": indicators,
+            "vectorized": vectorized,
+        }
+        for symbol in dict.fromkeys(symbol.upper() for symbol in symbols)
+    ]
+    if not jobs:
+        return {}
+
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(jobs)))
+    if workers == 1:
+        results = [_run_backtest_job(job) for job in jobs]
+    else:
+        results = None
+        if _can_run_in_subprocess(strategy):
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(_run_backtest_job, jobs))
+            except BrokenProcessPool as e:
+                # e.g. spawned workers re-running an unguarded __main__
+                logger.warning(f"Backtest worker processes failed, using threads: {e}")
+        else:
+            logger.debug("Strategy can't be sent to worker processes, using threads")
+
+        if results is None:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_run_backtest_job, jobs))
+
+    return {result.symbol: result for result in results if result is not None}
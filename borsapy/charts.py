@@ -20,11 +20,14 @@ from __future__ import annotations
 
 import numpy as np
 import pandas as pd
+from numpy.typing import DTypeLike
 
-__all__ = ["calculate_heikin_ashi"]
+__all__ = ["calculate_heikin_ashi", "calculate_heikin_ashi_bulk"]
 
+_HA_COLUMNS = ["HA_Open", "HA_High", "HA_Low", "HA_Close"]
 
-def calculate_heikin_ashi(df: pd.DataFrame) -> pd.DataFrame:
+
+def calculate_heikin_ashi(df: pd.DataFrame, dtype: DTypeLike = np.float64) -> pd.DataFrame:
     """Calculate Heikin Ashi candlestick values.
 
     Heikin Ashi candles smooth price data and help identify trends more clearly.
@@ -41,6 +44,10 @@ def calculate_heikin_ashi(df: pd.DataFrame) -> pd.DataFrame:
     Args:
         df: DataFrame with OHLC columns (Open, High, Low, Close).
             May also include Volume which will be preserved.
+        dtype: Float dtype of the HA columns. np.float32 halves their memory,
+            useful when holding HA for many symbols; it keeps about 7
+            significant digits, so prices like 1234.5678 round in the last
+            place. Defaults to np.float64.
 
     Returns:
         DataFrame with columns:
@@ -77,42 +84,151 @@ def calculate_heikin_ashi(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame(columns=["HA_Open", "HA_High", "HA_Low", "HA_Close", "Volume"])
 
+    o, h, lo, c = df[required].to_numpy(dtype=dtype).T
+
+    # All four outputs live in one preallocated block and every step below
+    # writes into it in place, so no temporary arrays are allocated
+    ha = np.empty((4, len(df)), dtype=dtype)
+    ha_open, ha_high, ha_low, ha_close = ha
+
     # Calculate HA_Close: (O + H + L + C) / 4
-    ha_close = (df["Open"] + df["High"] + df["Low"] + df["Close"]) / 4
+    np.add(o, h, out=ha_close)
+    ha_close += lo
+    ha_close += c
+    ha_close /= 4
+
+    # Calculate HA_Open (depends on previous HA values)
+    _ha_open_scan(ha_close, o[0], c[0], out=ha_open)
+
+    # Calculate HA_High and HA_Low. fmax/fmin skip NaN like a pandas row-wise
+    # max/min, so one missing bar (whose NaN HA_Open carries forward through
+    # the recurrence) does not blank out every later High/Low
+    np.fmax(ha_open, ha_close, out=ha_high)
+    np.fmax(h, ha_high, out=ha_high)
+    np.fmin(ha_open, ha_close, out=ha_low)
+    np.fmin(lo, ha_low, out=ha_low)
+
+    # Build result DataFrame: the transposed block becomes the frame's single
+    # float64 block as-is, with no per-column copy or consolidation
+    result = pd.DataFrame(ha.T, index=df.index, columns=_HA_COLUMNS, copy=False)
+
+    # Preserve Volume if present; the result shares df's index, so assign the
+    # raw values positionally instead of re-aligning a Series on the index
+    if "Volume" in df.columns:
+        result["Volume"] = df["Volume"].to_numpy()
 
-    # Calculate HA_Open iteratively (depends on previous HA values)
-    ha_open = np.zeros(len(df))
+    return result
 
-    # First candle: HA_Open = (Open + Close) / 2
-    ha_open[0] = (df["Open"].iloc[0] + df["Close"].iloc[0]) / 2
 
-    # Subsequent candles: HA_Open = (Prev_HA_Open + Prev_HA_Close) / 2
-    for i in range(1, len(df)):
-        ha_open[i] = (ha_open[i - 1] + ha_close.iloc[i - 1]) / 2
+def calculate_heikin_ashi_bulk(
+    frames: dict[str, pd.DataFrame], dtype: DTypeLike = np.float64
+) -> dict[str, pd.DataFrame]:
+    """Calculate Heikin Ashi candles for many symbols at once.
 
-    # Convert to Series with proper index
-    ha_open = pd.Series(ha_open, index=df.index)
+    All symbols are stacked into one (bars, symbols) block per price, so each
+    step of the calculation is a single NumPy operation across every symbol.
+    The HA_Open recurrence still walks the bars in order, but each step
+    advances all symbols together. Results match calculate_heikin_ashi()
+    exactly; use this when screening tens or hundreds of symbols.
 
-    # Calculate HA_High and HA_Low
-    ha_high = pd.concat([df["High"], ha_open, ha_close], axis=1).max(axis=1)
-    ha_low = pd.concat([df["Low"], ha_open, ha_close], axis=1).min(axis=1)
+    Args:
+        frames: Mapping of symbol to DataFrame with OHLC columns
+            (Open, High, Low, Close). Frames may have different lengths.
+            Volume is preserved where present.
+        dtype: Float dtype of the HA columns, as in calculate_heikin_ashi().
 
-    # Build result DataFrame
-    result = pd.DataFrame(
-        {
-            "HA_Open": ha_open,
-            "HA_High": ha_high,
-            "HA_Low": ha_low,
-            "HA_Close": ha_close,
-        },
-        index=df.index,
-    )
+    Returns:
+        Mapping of symbol to Heikin Ashi DataFrame, in the input order,
+        with the same columns as calculate_heikin_ashi().
 
-    # Preserve Volume if present
-    if "Volume" in df.columns:
-        result["Volume"] = df["Volume"]
+    Examples:
+        >>> import borsapy as bp
+        >>> frames = {s: bp.Ticker(s).history(period="1y") for s in ["THYAO", "GARAN"]}
+        >>> ha = bp.calculate_heikin_ashi_bulk(frames)
+        >>> ha["THYAO"].tail()
 
-    return result
+    Raises:
+        ValueError: If required OHLC columns are missing in any frame
+    """
+    required = ["Open", "High", "Low", "Close"]
+    for symbol, df in frames.items():
+        missing = [col for col in required if col not in df.columns]
+        if missing:
+            raise ValueError(f"Missing required columns for {symbol}: {missing}")
+
+    results: dict[str, pd.DataFrame] = {}
+    active = [(symbol, df) for symbol, df in frames.items() if not df.empty]
+    if active:
+        # Frames are left-aligned and NaN-padded; padded bars never feed
+        # back into a real bar, so they are simply dropped afterwards
+        n_max = max(len(df) for _, df in active)
+        ohlc = np.full((4, n_max, len(active)), np.nan, dtype=dtype)
+        for j, (_, df) in enumerate(active):
+            ohlc[:, : len(df), j] = df[required].to_numpy(dtype=dtype).T
+        o, h, lo, c = ohlc
+
+        ha = np.empty_like(ohlc)
+        ha_open, ha_high, ha_low, ha_close = ha
+
+        # Same in-place steps as calculate_heikin_ashi, over all symbols
+        np.add(o, h, out=ha_close)
+        ha_close += lo
+        ha_close += c
+        ha_close /= 4
+
+        # HA_Open recurrence, one bar at a time for every symbol
+        np.add(o[0], c[0], out=ha_open[0])
+        ha_open[0] /= 2
+        for i in range(1, n_max):
+            np.add(ha_open[i - 1], ha_close[i - 1], out=ha_open[i])
+            ha_open[i] /= 2
+
+        # NaN-skipping, as in calculate_heikin_ashi
+        np.fmax(ha_open, ha_close, out=ha_high)
+        np.fmax(h, ha_high, out=ha_high)
+        np.fmin(ha_open, ha_close, out=ha_low)
+        np.fmin(lo, ha_low, out=ha_low)
+
+        for j, (symbol, df) in enumerate(active):
+            # Copy each symbol's slice out so results don't pin the whole block
+            result = pd.DataFrame(ha[:, : len(df), j].T.copy(), index=df.index, columns=_HA_COLUMNS)
+            if "Volume" in df.columns:
+                result["Volume"] = df["Volume"].to_numpy()
+            results[symbol] = result
+
+    # Empty frames get the same empty result as calculate_heikin_ashi()
+    return {
+        symbol: results[symbol] if symbol in results else calculate_heikin_ashi(df, dtype)
+        for symbol, df in frames.items()
+    }
+
+
+def _ha_open_scan(
+    ha_close: np.ndarray,
+    first_open: float,
+    first_close: float,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Run the HA_Open recurrence over an HA_Close array.
+
+    The recurrence is sequential, so it runs as a plain loop over Python floats
+    (no per-row pandas indexing) and writes the result into one array, ``out``
+    if given.
+    """
+    ha_open = np.empty(len(ha_close), dtype=ha_close.dtype) if out is None else out
+    if len(ha_close) == 0:
+        return ha_open
+
+    # First candle: HA_Open = (Open + Close) / 2
+    prev = (first_open + first_close) / 2
+    ha_open[0] = prev
+
+    # Subsequent candles: HA_Open = (Prev_HA_Open + Prev_HA_Close) / 2
+    for i, prev_close in enumerate(ha_close[:-1].tolist(), start=1):
+        prev = (prev + prev_close) / 2
+        ha_open[i] = prev
+
+    return ha_open
 
 
 def calculate_heikin_ashi_vectorized(df: pd.DataFrame) -> pd.DataFrame:
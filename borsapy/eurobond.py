@@ -89,9 +89,12 @@ class Eurobond:
             isin: ISIN code (e.g., "US900123DG28").
 
         Raises:
-            DataNotAvailableError: If bond not found.
+            DataNotAvailableError: If the ISIN is malformed or the bond is not found.
         """
         self._isin = isin.upper()
+        # ISINs are 12 alphanumerics; reject obvious typos without a lookup
+        if len(self._isin) != 12 or not self._isin.isascii() or not self._isin.isalnum():
+            raise DataNotAvailableError(f"Invalid ISIN: {isin}")
         self._provider = get_eurobond_provider()
         self._data_cache: dict | None = None
 
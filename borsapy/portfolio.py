@@ -16,6 +16,7 @@ Examples:
 
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Any, Literal
 
 import numpy as np
@@ -54,6 +55,10 @@ FX_METALS = {
 
 FX_COMMODITIES = {"BRENT", "XAG-USD", "XPT-USD", "XPD-USD"}
 
+# Currencies/commodities match upper-cased, metals match as given (lowercase
+# slugs), so one set serves both lookups without cross-matching
+_FX_SYMBOLS = frozenset(FX_CURRENCIES | FX_METALS | FX_COMMODITIES)
+
 
 AssetType = Literal["stock", "fx", "crypto", "fund"]
 
@@ -69,6 +74,7 @@ class Holding:
     purchase_date: date | None = None
 
 
+@lru_cache(maxsize=4096)
 def _detect_asset_type(symbol: str) -> AssetType:
     """Auto-detect asset type from symbol.
 
@@ -83,10 +89,8 @@ def _detect_asset_type(symbol: str) -> AssetType:
     Returns:
         Detected asset type.
     """
-    upper = symbol.upper()
-
     # Currency check
-    if upper in FX_CURRENCIES or symbol in FX_METALS or upper in FX_COMMODITIES:
+    if symbol in _FX_SYMBOLS or symbol.upper() in _FX_SYMBOLS:
         return "fx"
 
     # Crypto check (BTCTRY, ETHTRY, etc.)
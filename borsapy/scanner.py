@@ -45,7 +45,7 @@ from borsapy._providers.tradingview_screener_native import get_tv_screener_provi
 __all__ = ["TechnicalScanner", "ScanResult", "scan"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     """Result of scanning a single symbol.
 
@@ -872,54 +872,72 @@ class TechnicalAnalyzer:
         self._df = df.copy()
         self._has_volume = "Volume" in df.columns
         self._has_hlc = all(col in df.columns for col in ["High", "Low", "Close"])
+        # (indicator, *params) -> computed result; self._df never changes
+        self._cache: dict[tuple[Any, ...], Any] = {}
+
+    def _cached(self, key: tuple[Any, ...], func: Any, *args: Any) -> Any:
+        """Compute func(self._df, *args) once per key and return a copy.
+
+        Indicators are reused across calls (e.g. latest, or screeners asking
+        for the same SMA under several conditions); the copy keeps callers
+        from mutating the cached result.
+        """
+        result = self._cache.get(key)
+        if result is None:
+            result = self._cache[key] = func(self._df, *args)
+        return result.copy()
 
     def sma(self, period: int = 20) -> pd.Series:
         """Calculate Simple Moving Average."""
-        return calculate_sma(self._df, period)
+        return self._cached(("sma", period), calculate_sma, period)
 
     def ema(self, period: int = 20) -> pd.Series:
         """Calculate Exponential Moving Average."""
-        return calculate_ema(self._df, period)
+        return self._cached(("ema", period), calculate_ema, period)
 
     def tilson_t3(self, period: int = 5, vfactor: float = 0.7) -> pd.Series:
         """Calculate Tilson T3 Moving Average."""
-        return calculate_tilson_t3(self._df, period, vfactor)
+        return self._cached(("tilson_t3", period, vfactor), calculate_tilson_t3, period, vfactor)
 
     def rsi(self, period: int = 14) -> pd.Series:
         """Calculate Relative Strength Index."""
-        return calculate_rsi(self._df, period)
+        return self._cached(("rsi", period), calculate_rsi, period)
 
     def macd(
         self, fast: int = 12, slow: int = 26, signal: int = 9
     ) -> pd.DataFrame:
         """Calculate MACD (line, signal, histogram)."""
-        return calculate_macd(self._df, fast, slow, signal)
+        return self._cached(("macd", fast, slow, signal), calculate_macd, fast, slow, signal)
 
     def bollinger_bands(
         self, period: int = 20, std_dev: float = 2.0
     ) -> pd.DataFrame:
         """Calculate Bollinger Bands (upper, middle, lower)."""
-        return calculate_bollinger_bands(self._df, period, std_dev)
+        return self._cached(
+            ("bollinger_bands", period, std_dev), calculate_bollinger_bands, period, std_dev
+        )
 
     def atr(self, period: int = 14) -> pd.Series:
         """Calculate Average True Range."""
-        return calculate_atr(self._df, period)
+        return self._cached(("atr", period), calculate_atr, period)
 
     def stochastic(self, k_period: int = 14, d_period: int = 3) -> pd.DataFrame:
         """Calculate Stochastic Oscillator (%K, %D)."""
-        return calculate_stochastic(self._df, k_period, d_period)
+        return self._cached(
+            ("stochastic", k_period, d_period), calculate_stochastic, k_period, d_period
+        )
 
     def obv(self) -> pd.Series:
         """Calculate On-Balance Volume."""
-        return calculate_obv(self._df)
+        return self._cached(("obv",), calculate_obv)
 
     def vwap(self) -> pd.Series:
         """Calculate Volume Weighted Average Price."""
-        return calculate_vwap(self._df)
+        return self._cached(("vwap",), calculate_vwap)
 
     def adx(self, period: int = 14) -> pd.Series:
         """Calculate Average Directional Index."""
-        return calculate_adx(self._df, period)
+        return self._cached(("adx", period), calculate_adx, period)
 
     def supertrend(self, atr_period: int = 10, multiplier: float = 3.0) -> pd.DataFrame:
         """Calculate Supertrend indicator.
@@ -931,35 +949,37 @@ class TechnicalAnalyzer:
         Returns:
             DataFrame with Supertrend, Supertrend_Direction, Supertrend_Upper, Supertrend_Lower
         """
-        return calculate_supertrend(self._df, atr_period, multiplier)
+        return self._cached(
+            ("supertrend", atr_period, multiplier), calculate_supertrend, atr_period, multiplier
+        )
 
     def hhv(self, period: int = 14, column: str = "High") -> pd.Series:
         """Calculate Highest High Value (HHV)."""
-        return calculate_hhv(self._df, period, column)
+        return self._cached(("hhv", period, column), calculate_hhv, period, column)
 
     def llv(self, period: int = 14, column: str = "Low") -> pd.Series:
         """Calculate Lowest Low Value (LLV)."""
-        return calculate_llv(self._df, period, column)
+        return self._cached(("llv", period, column), calculate_llv, period, column)
 
     def mom(self, period: int = 10) -> pd.Series:
         """Calculate Momentum (MOM)."""
-        return calculate_mom(self._df, period)
+        return self._cached(("mom", period), calculate_mom, period)
 
     def roc(self, period: int = 10) -> pd.Series:
         """Calculate Rate of Change (ROC)."""
-        return calculate_roc(self._df, period)
+        return self._cached(("roc", period), calculate_roc, period)
 
     def wma(self, period: int = 20) -> pd.Series:
         """Calculate Weighted Moving Average (WMA)."""
-        return calculate_wma(self._df, period)
+        return self._cached(("wma", period), calculate_wma, period)
 
     def dema(self, period: int = 20) -> pd.Series:
         """Calculate Double Exponential Moving Average (DEMA)."""
-        return calculate_dema(self._df, period)
+        return self._cached(("dema", period), calculate_dema, period)
 
     def tema(self, period: int = 20) -> pd.Series:
         """Calculate Triple Exponential Moving Average (TEMA)."""
-        return calculate_tema(self._df, period)
+        return self._cached(("tema", period), calculate_tema, period)
 
     def heikin_ashi(self) -> pd.DataFrame:
         """Calculate Heikin Ashi candlestick values.
@@ -969,7 +989,7 @@ class TechnicalAnalyzer:
         """
         from borsapy.charts import calculate_heikin_ashi
 
-        return calculate_heikin_ashi(self._df)
+        return self._cached(("heikin_ashi",), calculate_heikin_ashi)
 
     def all(self, **kwargs: Any) -> pd.DataFrame:
         """Get DataFrame with all applicable indicators added."""
@@ -10,20 +10,37 @@ Kullanım:
     Tarayıcıda http://localhost:5000 adresine gidin.
 
 Gereksinimler:
-    pip install borsapy flask pandas
+    pip install borsapy flask pandas numpy
+    pip install waitress orjson  # isteğe bağlı: üretim WSGI sunucusu, hızlı JSON
 """
 
+import gzip
 import json
+import os
+import pickle
+import queue
+import tempfile
 import threading
+import time
 from datetime import datetime
-from flask import Flask, render_template_string, jsonify, request
+from pathlib import Path
+from flask import Flask, Response, jsonify, request
 
+import numpy as np
 import pandas as pd
 import borsapy as bp
 
+try:
+    import orjson
+except ImportError:  # orjson isteğe bağlı, yoksa stdlib json kullanılır
+    orjson = None
+
 app = Flask(__name__)
 
-# Global state for scan progress
+# Global state for scan progress (guarded by scan_lock, changes signalled
+# through scan_changed for /api/stream listeners)
+scan_lock = threading.Lock()
+scan_changed = threading.Condition(scan_lock)
 scan_state = {
     "running": False,
     "progress": 0,
@@ -32,6 +49,7 @@ scan_state = {
     "results": [],
     "last_scan": None,
     "error": None,
+    "stats": None,
 }
 
 # Banka ve finans sektörü hisseleri
@@ -42,6 +60,32 @@ BANK_SYMBOLS = {
     "VAKFA", "ULUFA", "LIDFA", "GLCVY",
 }
 
+# Gelir tablolarını eşzamanlı indiren işçi sayısı ve iş kuyruğu boyutu
+SCAN_WORKERS = max(1, int(os.environ.get("BORSAPY_SCAN_WORKERS", "8")))
+SCAN_QUEUE_SIZE = 64
+
+# Başarısız indirmeler için deneme sayısı ve en uzun bekleme (saniye)
+FETCH_RETRIES = 3
+FETCH_BACKOFF_MAX = 30
+
+# Gelir tablosu disk önbelleği
+INCOME_STMT_CACHE_DIR = Path.home() / ".cache" / "borsapy" / "income_stmt"
+INCOME_STMT_CACHE_TTL = 86400  # 24 saat
+
+# Gelir tablosu satır anahtar kelimeleri (öncelik sırasıyla, küçük harf)
+REVENUE_KEYWORDS = tuple(
+    k.lower() for k in ("Satış Gelirleri", "Hasılat", "Net Satışlar")
+)
+NET_INCOME_KEYWORDS = tuple(
+    k.lower()
+    for k in (
+        "Ana Ortaklık Payları",
+        "SÜRDÜRÜLEN FAALİYETLER DÖNEM KARI",
+        "Dönem Net Kar",
+        "Net Dönem Karı",
+    )
+)
+
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="tr">
@@ -264,6 +308,30 @@ HTML_TEMPLATE = """
                     <tbody id="resultsBody" class="divide-y divide-gray-100">
                     </tbody>
                 </table>
+                <template id="rowTpl">
+                    <tr class="table-row fade-in">
+                        <td class="px-6 py-4">
+                            <div class="flex items-center space-x-3">
+                                <div class="row-badge bg-gradient-to-br from-purple-500 to-indigo-600 text-white w-10 h-10 rounded-lg flex items-center justify-center font-bold text-sm"></div>
+                                <div>
+                                    <div class="row-symbol font-semibold text-gray-800"></div>
+                                    <div class="row-name text-sm text-gray-500 truncate max-w-[200px]"></div>
+                                </div>
+                            </div>
+                        </td>
+                        <td class="px-6 py-4">
+                            <span class="row-pe inline-flex items-center px-3 py-1 rounded-full text-sm font-medium bg-green-100 text-green-800"></span>
+                        </td>
+                        <td class="px-6 py-4">
+                            <div class="row-sparkline sparkline"></div>
+                            <div class="row-margins text-xs text-gray-500 mt-1"></div>
+                        </td>
+                        <td class="row-quarters px-6 py-4 text-sm text-gray-600"></td>
+                        <td class="px-6 py-4">
+                            <span class="row-change inline-flex items-center text-sm font-medium"></span>
+                        </td>
+                    </tr>
+                </template>
             </div>
         </div>
 
@@ -300,7 +368,7 @@ HTML_TEMPLATE = """
         lucide.createIcons();
 
         let scanResults = [];
-        let pollInterval = null;
+        let progressStream = null;
 
         function startScan() {
             const peMax = document.getElementById('peMax').value;
@@ -319,133 +387,115 @@ HTML_TEMPLATE = """
             document.getElementById('resultsSection').classList.add('hidden');
             document.getElementById('statsSection').classList.add('hidden');
 
-            // Start scan
+            // Start scan, then listen for progress updates
             fetch('/api/scan', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({ pe_max: parseFloat(peMax), quarters: parseInt(quarters), index: indexFilter })
+            }).then(() => {
+                progressStream = new EventSource('/api/stream');
+                progressStream.onmessage = (event) => handleProgress(JSON.parse(event.data));
             });
-
-            // Poll for progress
-            pollInterval = setInterval(pollProgress, 500);
         }
 
-        function pollProgress() {
-            fetch('/api/progress')
-                .then(res => res.json())
-                .then(data => {
-                    if (data.running) {
-                        const percent = data.total > 0 ? (data.progress / data.total * 100) : 0;
-                        document.getElementById('progressBar').style.width = percent + '%';
-                        document.getElementById('progressText').textContent = `${data.progress} / ${data.total}`;
-                        document.getElementById('currentSymbol').textContent = `İnceleniyor: ${data.current_symbol}`;
-                    } else {
-                        clearInterval(pollInterval);
-
-                        // Hide progress
-                        document.getElementById('progressSection').classList.add('hidden');
-
-                        // Re-enable button
-                        const btn = document.getElementById('scanBtn');
-                        btn.disabled = false;
-                        btn.innerHTML = '<i data-lucide="search" class="w-4 h-4"></i><span>Taramayı Başlat</span>';
-                        lucide.createIcons();
-
-                        // Show results
-                        if (data.results && data.results.length > 0) {
-                            scanResults = data.results;
-                            displayResults(data.results);
-                            updateStats(data.results);
-                            document.getElementById('resultsSection').classList.remove('hidden');
-                            document.getElementById('statsSection').classList.remove('hidden');
-                        } else {
-                            document.getElementById('emptyState').classList.remove('hidden');
-                            document.getElementById('emptyState').querySelector('h3').textContent = 'Sonuç Bulunamadı';
-                            document.getElementById('emptyState').querySelector('p').textContent = 'Kriterlere uyan hisse bulunamadı. Filtreleri gevşetmeyi deneyin.';
-                        }
+        function handleProgress(data) {
+            if (data.running) {
+                const percent = data.total > 0 ? (data.progress / data.total * 100) : 0;
+                document.getElementById('progressBar').style.width = percent + '%';
+                document.getElementById('progressText').textContent = `${data.progress} / ${data.total}`;
+                document.getElementById('currentSymbol').textContent = `İnceleniyor: ${data.current_symbol}`;
 
-                        if (data.last_scan) {
-                            document.getElementById('lastScan').textContent = `Son tarama: ${data.last_scan}`;
-                        }
-                    }
-                });
+                // Live stats as matches come in
+                if (data.stats && data.stats.count > 0) {
+                    updateStats(data.stats);
+                    document.getElementById('statsSection').classList.remove('hidden');
+                }
+            } else {
+                progressStream.close();
+
+                // Hide progress
+                document.getElementById('progressSection').classList.add('hidden');
+
+                // Re-enable button
+                const btn = document.getElementById('scanBtn');
+                btn.disabled = false;
+                btn.innerHTML = '<i data-lucide="search" class="w-4 h-4"></i><span>Taramayı Başlat</span>';
+                lucide.createIcons();
+
+                // Show results
+                if (data.results && data.results.length > 0) {
+                    scanResults = prepareResults(data.results);
+                    displayResults(data.results);
+                    updateStats(data.stats);
+                    document.getElementById('resultsSection').classList.remove('hidden');
+                    document.getElementById('statsSection').classList.remove('hidden');
+                } else {
+                    document.getElementById('emptyState').classList.remove('hidden');
+                    document.getElementById('emptyState').querySelector('h3').textContent = 'Sonuç Bulunamadı';
+                    document.getElementById('emptyState').querySelector('p').textContent = 'Kriterlere uyan hisse bulunamadı. Filtreleri gevşetmeyi deneyin.';
+                }
+
+                if (data.last_scan) {
+                    document.getElementById('lastScan').textContent = `Son tarama: ${data.last_scan}`;
+                }
+            }
+        }
+
+        function prepareResults(results) {
+            // Compute margins and change once per row for table and stats
+            for (const r of results) {
+                r._margins = [r.margin_q1, r.margin_q2, r.margin_q3].filter(m => m !== null);
+                r._change = r._margins.length >= 2 ? r._margins[r._margins.length - 1] - r._margins[0] : 0;
+            }
+            return results;
         }
 
         function displayResults(results) {
-            const tbody = document.getElementById('resultsBody');
-            tbody.innerHTML = '';
+            const rowTpl = document.getElementById('rowTpl').content.firstElementChild;
+            const frag = document.createDocumentFragment();
 
             results.forEach((row, idx) => {
-                const margins = [row.margin_q1, row.margin_q2, row.margin_q3].filter(m => m !== null);
-                const change = margins.length >= 2 ? margins[margins.length - 1] - margins[0] : 0;
-                const changePercent = margins[0] !== 0 ? ((margins[margins.length - 1] - margins[0]) / Math.abs(margins[0]) * 100) : 0;
+                const margins = row._margins;
+                const change = row._change;
 
-                const tr = document.createElement('tr');
-                tr.className = 'table-row fade-in';
+                const tr = rowTpl.cloneNode(true);
                 tr.style.animationDelay = `${idx * 50}ms`;
 
-                tr.innerHTML = `
-                    <td class="px-6 py-4">
-                        <div class="flex items-center space-x-3">
-                            <div class="bg-gradient-to-br from-purple-500 to-indigo-600 text-white w-10 h-10 rounded-lg flex items-center justify-center font-bold text-sm">
-                                ${row.symbol.substring(0, 2)}
-                            </div>
-                            <div>
-                                <div class="font-semibold text-gray-800">${row.symbol}</div>
-                                <div class="text-sm text-gray-500 truncate max-w-[200px]">${row.name || ''}</div>
-                            </div>
-                        </div>
-                    </td>
-                    <td class="px-6 py-4">
-                        <span class="inline-flex items-center px-3 py-1 rounded-full text-sm font-medium bg-green-100 text-green-800">
-                            ${row.pe ? row.pe.toFixed(2) : 'N/A'}
-                        </span>
-                    </td>
-                    <td class="px-6 py-4">
-                        <div class="sparkline">
-                            ${margins.map((m, i) => {
-                                const height = Math.min(100, Math.max(10, (m + 50) * 0.8));
-                                const color = m >= 0 ? 'bg-green-400' : 'bg-red-400';
-                                return `<div class="sparkline-bar ${color}" style="height: ${height}%" title="${m.toFixed(1)}%"></div>`;
-                            }).join('')}
-                        </div>
-                        <div class="text-xs text-gray-500 mt-1">
-                            ${margins.map(m => m.toFixed(1) + '%').join(' → ')}
-                        </div>
-                    </td>
-                    <td class="px-6 py-4 text-sm text-gray-600">
-                        ${row.quarters || ''}
-                    </td>
-                    <td class="px-6 py-4">
-                        <span class="inline-flex items-center text-sm font-medium ${change >= 0 ? 'text-green-600' : 'text-red-600'}">
-                            ${change >= 0 ? '↑' : '↓'} ${Math.abs(change).toFixed(1)} puan
-                        </span>
-                    </td>
-                `;
-
-                tbody.appendChild(tr);
-            });
-        }
+                tr.querySelector('.row-badge').textContent = row.symbol.substring(0, 2);
+                tr.querySelector('.row-symbol').textContent = row.symbol;
+                tr.querySelector('.row-name').textContent = row.name || '';
+                tr.querySelector('.row-pe').textContent = row.pe ? row.pe.toFixed(2) : 'N/A';
+                // Build sparkline bars and margin labels in one pass
+                let bars = '';
+                const labels = [];
+                for (const m of margins) {
+                    const height = Math.min(100, Math.max(10, (m + 50) * 0.8));
+                    const color = m >= 0 ? 'bg-green-400' : 'bg-red-400';
+                    const label = m.toFixed(1) + '%';
+                    bars += `<div class="sparkline-bar ${color}" style="height: ${height}%" title="${label}"></div>`;
+                    labels.push(label);
+                }
+                tr.querySelector('.row-sparkline').innerHTML = bars;
+                tr.querySelector('.row-margins').textContent = labels.join(' → ');
+                tr.querySelector('.row-quarters').textContent = row.quarters || '';
 
-        function updateStats(results) {
-            document.getElementById('statTotal').textContent = results.length;
+                const changeEl = tr.querySelector('.row-change');
+                changeEl.classList.add(change >= 0 ? 'text-green-600' : 'text-red-600');
+                changeEl.textContent = `${change >= 0 ? '↑' : '↓'} ${Math.abs(change).toFixed(1)} puan`;
 
-            const pes = results.map(r => r.pe).filter(p => p !== null);
-            const avgPE = pes.length > 0 ? (pes.reduce((a, b) => a + b, 0) / pes.length).toFixed(2) : '0';
-            document.getElementById('statAvgPE').textContent = avgPE;
+                frag.appendChild(tr);
+            });
 
-            const minPE = pes.length > 0 ? Math.min(...pes).toFixed(2) : '0';
-            document.getElementById('statMinPE').textContent = minPE;
+            // Single DOM update for all rows
+            document.getElementById('resultsBody').replaceChildren(frag);
+        }
 
-            let maxGrowth = 0;
-            results.forEach(r => {
-                const margins = [r.margin_q1, r.margin_q2, r.margin_q3].filter(m => m !== null);
-                if (margins.length >= 2) {
-                    const growth = margins[margins.length - 1] - margins[0];
-                    if (growth > maxGrowth) maxGrowth = growth;
-                }
-            });
-            document.getElementById('statMaxGrowth').textContent = maxGrowth.toFixed(1) + ' puan';
+        function updateStats(stats) {
+            // Aggregates are maintained by the server while the scan runs
+            document.getElementById('statTotal').textContent = stats.count;
+            document.getElementById('statAvgPE').textContent = stats.pe_count > 0 ? (stats.pe_sum / stats.pe_count).toFixed(2) : '0';
+            document.getElementById('statMinPE').textContent = stats.min_pe !== null ? stats.min_pe.toFixed(2) : '0';
+            document.getElementById('statMaxGrowth').textContent = stats.max_growth.toFixed(1) + ' puan';
         }
 
         function exportCSV() {
@@ -468,9 +518,9 @@ HTML_TEMPLATE = """
             .then(res => res.json())
             .then(data => {
                 if (data.results && data.results.length > 0 && !data.running) {
-                    scanResults = data.results;
+                    scanResults = prepareResults(data.results);
                     displayResults(data.results);
-                    updateStats(data.results);
+                    updateStats(data.stats);
                     document.getElementById('resultsSection').classList.remove('hidden');
                     document.getElementById('statsSection').classList.remove('hidden');
                     document.getElementById('emptyState').classList.add('hidden');
@@ -486,52 +536,79 @@ HTML_TEMPLATE = """
 """
 
 
-def calculate_net_margin(income_stmt: pd.DataFrame) -> pd.Series:
-    """Gelir tablosundan net kar marjını hesapla."""
-    revenue_keywords = ["Satış Gelirleri", "Hasılat", "Net Satışlar"]
-    net_income_keywords = [
-        "Ana Ortaklık Payları",
-        "SÜRDÜRÜLEN FAALİYETLER DÖNEM KARI",
-        "Dönem Net Kar",
-        "Net Dönem Karı",
-    ]
-
-    index_list = income_stmt.index.tolist()
-    revenue_idx = None
-    net_income_idx = None
-
-    for keyword in revenue_keywords:
-        for idx in index_list:
-            if keyword.lower() in str(idx).lower():
-                revenue_idx = idx
-                break
-        if revenue_idx:
-            break
-
-    for keyword in net_income_keywords:
-        for idx in index_list:
-            if keyword.lower() in str(idx).lower():
-                net_income_idx = idx
-                break
-        if net_income_idx:
-            break
+def _find_row(index: pd.Index, lowered: pd.Index, keywords: tuple[str, ...]):
+    """Anahtar kelime sırasına göre ilk eşleşen satır etiketini bul."""
+    for keyword in keywords:
+        hits = np.flatnonzero(lowered.str.contains(keyword, regex=False))
+        if hits.size:
+            return index[hits[0]]
+    return None
+
+
+def calculate_net_margin(income_stmt: pd.DataFrame, min_quarters: int = 0) -> pd.Series:
+    """Gelir tablosundan net kar marjını hesapla.
+
+    min_quarters verilirse, bu sayıdan az çeyrek sütunu olan tablolar için
+    hesaplama yapılmadan boş seri döner.
+    """
+    index = income_stmt.index
+    lowered = index.astype(str).str.lower()
+    revenue_idx = _find_row(index, lowered, REVENUE_KEYWORDS)
+    net_income_idx = _find_row(index, lowered, NET_INCOME_KEYWORDS)
 
     if revenue_idx is None or net_income_idx is None:
         return pd.Series(dtype=float)
 
-    quarter_cols = [col for col in income_stmt.columns if "Q" in str(col)]
-    margins = {}
+    columns = income_stmt.columns
+    quarter_cols = columns[columns.astype(str).str.contains("Q", regex=False)].tolist()
+    if not quarter_cols or len(quarter_cols) < min_quarters:
+        return pd.Series(dtype=float)
 
-    for col in quarter_cols:
-        try:
-            revenue = float(income_stmt.loc[revenue_idx, col])
-            net_income = float(income_stmt.loc[net_income_idx, col])
-            if revenue != 0 and pd.notna(revenue) and pd.notna(net_income):
-                margins[col] = (net_income / revenue) * 100
-        except (ValueError, TypeError, KeyError):
-            continue
+    # Gelir ve net kar satırlarını tek seferde NumPy matrisine al
+    rows = income_stmt.loc[[revenue_idx, net_income_idx], quarter_cols]
+    mat = rows.apply(pd.to_numeric, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    revenue, net_income = mat[0], mat[1]
+
+    # Yalnızca geçerli hücrelerde böl; diğerleri NaN kalır ve atılır
+    valid = (revenue != 0) & np.isfinite(revenue) & np.isfinite(net_income)
+    margins = np.full_like(revenue, np.nan)
+    margins[valid] = net_income[valid] / revenue[valid] * 100
 
-    return pd.Series(margins)
+    return pd.Series(margins, index=quarter_cols)[valid]
+
+
+def get_cached_income_stmt(symbol: str) -> pd.DataFrame:
+    """Çeyreklik gelir tablosunu disk önbelleği üzerinden getir.
+
+    borsapy aynı süreç içinde tabloları zaten bellekte önbelleğe alır; disk
+    önbelleği ise sunucu yeniden başlatıldığında tekrar indirmeyi önler.
+    """
+    path = INCOME_STMT_CACHE_DIR / f"{symbol}.pkl"
+    try:
+        if time.time() - path.stat().st_mtime < INCOME_STMT_CACHE_TTL:
+            return pd.read_pickle(path)
+    except OSError:
+        pass
+    except (EOFError, ValueError, pickle.UnpicklingError):
+        # Yarım yazılmış/bozuk dosya: silip yeniden indir, yoksa TTL boyunca
+        # sembol her taramada sessizce atlanır
+        path.unlink(missing_ok=True)
+
+    income_stmt = bp.Ticker(symbol).get_income_stmt(quarterly=True)
+    if not income_stmt.empty:
+        tmp_name = None
+        try:
+            INCOME_STMT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Önce aynı dizinde geçici dosyaya yaz, sonra atomik olarak yerine
+            # koy; yazma yarıda kesilirse önbellekte bozuk dosya kalmaz
+            fd, tmp_name = tempfile.mkstemp(dir=INCOME_STMT_CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                income_stmt.to_pickle(f)
+            os.replace(tmp_name, path)
+        except OSError:
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+    return income_stmt
 
 
 def is_margin_increasing(margins: pd.Series, last_n: int = 3) -> bool:
@@ -539,24 +616,118 @@ def is_margin_increasing(margins: pd.Series, last_n: int = 3) -> bool:
     if len(margins) < last_n:
         return False
 
-    recent = margins.head(last_n).sort_index()
-    values = recent.values
+    # Son n çeyreği dönem sırasına diz ve tek NumPy karşılaştırmasıyla kontrol et
+    recent = margins.head(last_n)
+    order = np.argsort(recent.index.to_numpy(), kind="stable")
+    values = recent.to_numpy(dtype=np.float64)[order]
+
+    return bool((np.diff(values) > 0).all())
 
-    for i in range(1, len(values)):
-        if values[i] <= values[i - 1]:
-            return False
 
-    return True
+def _empty_stats() -> dict:
+    """Tarama sırasında güncellenen özet istatistiklerin başlangıç değeri."""
+    return {"count": 0, "pe_count": 0, "pe_sum": 0.0, "min_pe": None, "max_growth": 0.0}
+
+
+def _add_to_stats(stats: dict, result: dict) -> None:
+    """Yeni bir sonucu özet istatistiklere ekle (scan_lock tutulurken çağrılmalı)."""
+    stats["count"] += 1
+
+    pe = result["pe"]
+    if pe is not None and np.isfinite(pe):
+        stats["pe_count"] += 1
+        stats["pe_sum"] += float(pe)
+        if stats["min_pe"] is None or pe < stats["min_pe"]:
+            stats["min_pe"] = float(pe)
+
+    margins = [result[k] for k in ("margin_q1", "margin_q2", "margin_q3") if result[k] is not None]
+    if len(margins) >= 2:
+        stats["max_growth"] = max(stats["max_growth"], float(margins[-1] - margins[0]))
+
+
+def _update_state(**changes):
+    """scan_state'i kilit altında güncelle ve dinleyicileri uyandır."""
+    with scan_changed:
+        scan_state.update(changes)
+        scan_changed.notify_all()
+
+
+def _reset_for_new_scan():
+    """Yeni tarama için durumu sıfırla.
+
+    Önceki taramanın toplamı, sonuçları ve istatistikleri de temizlenir;
+    yoksa SSE dinleyicileri ilk sonuç gelene kadar eski değerleri görür.
+    """
+    _update_state(
+        running=True,
+        progress=0,
+        total=0,
+        current_symbol="",
+        results=[],
+        error=None,
+        stats=_empty_stats(),
+    )
+
+
+def _snapshot_state() -> dict:
+    """scan_state'in tutarlı bir kopyasını al (scan_lock tutulurken çağrılmalı)."""
+    snapshot = dict(scan_state)
+    snapshot["results"] = list(scan_state["results"])
+    return snapshot
+
+
+def fetch_income_stmt(symbol: str) -> pd.DataFrame:
+    """Gelir tablosunu getir; API/limit hatalarında artan beklemeyle yeniden dene."""
+    for attempt in range(FETCH_RETRIES):
+        try:
+            return get_cached_income_stmt(symbol)
+        except (bp.APIError, bp.RateLimitError):
+            if attempt == FETCH_RETRIES - 1:
+                raise
+            time.sleep(min(FETCH_BACKOFF_MAX, 2**attempt))
+
+
+def scan_symbol(symbol: str, name: str, pe, quarters: int) -> dict | None:
+    """Tek bir hisseyi incele, kriterlere uyuyorsa sonuç satırını döndür."""
+    try:
+        income_stmt = fetch_income_stmt(symbol)
+
+        if income_stmt.empty:
+            return None
+
+        margins = calculate_net_margin(income_stmt, min_quarters=quarters)
+
+        if margins.empty or not is_margin_increasing(margins, last_n=quarters):
+            return None
+
+        recent_margins = margins.head(quarters).sort_index()
+        margin_values = recent_margins.values
+        margin_quarters = recent_margins.index.tolist()
+
+        return {
+            "symbol": symbol,
+            "name": name,
+            "pe": pe,
+            "margin_q1": margin_values[0] if len(margin_values) > 0 else None,
+            "margin_q2": margin_values[1] if len(margin_values) > 1 else None,
+            "margin_q3": margin_values[2] if len(margin_values) > 2 else None,
+            "quarters": " → ".join(margin_quarters),
+        }
+
+    except Exception:
+        return None
+
+
+def _dumps(obj) -> bytes:
+    """JSON'a çevir; orjson kuruluysa onu kullan."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=str).encode("utf-8")
 
 
 def run_scan(pe_max: float, quarters: int, index: str | None):
     """Taramayı arka planda çalıştır."""
-    global scan_state
-
-    scan_state["running"] = True
-    scan_state["progress"] = 0
-    scan_state["results"] = []
-    scan_state["error"] = None
+    _reset_for_new_scan()
 
     try:
         # Düşük F/K'lı hisseleri bul
@@ -568,68 +739,80 @@ def run_scan(pe_max: float, quarters: int, index: str | None):
 
         low_pe_stocks = screener.run()
 
+        # Bankaları taramadan önce ayıkla, böylece toplam sayı gerçek işi gösterir
+        if not low_pe_stocks.empty:
+            low_pe_stocks = low_pe_stocks[
+                ~low_pe_stocks["symbol"].isin(BANK_SYMBOLS)
+            ].reset_index(drop=True)
+
         if low_pe_stocks.empty:
-            scan_state["running"] = False
-            scan_state["last_scan"] = datetime.now().strftime("%H:%M:%S")
+            _update_state(running=False, last_scan=datetime.now().strftime("%H:%M:%S"))
             return
 
-        scan_state["total"] = len(low_pe_stocks)
-        results = []
-
-        for idx, row in low_pe_stocks.iterrows():
-            symbol = row["symbol"]
-            name = row.get("name", "")
+        _update_state(total=len(low_pe_stocks))
+
+        # Sınırlı kuyruk + sabit sayıda işçi: sağlayıcıya giden eşzamanlı istek
+        # sayısı SCAN_WORKERS ile sınırlı kalır. Tüm işçiler borsapy'nin
+        # paylaşılan HTTP istemcisini kullanır.
+        work = queue.Queue(maxsize=SCAN_QUEUE_SIZE)
+        matches = {}
+
+        def worker():
+            while True:
+                item = work.get()
+                if item is None:
+                    return
+                pos, symbol, name, pe = item
+                result = scan_symbol(symbol, name, pe, quarters)
+                with scan_changed:
+                    if result is not None:
+                        matches[pos] = result
+                        _add_to_stats(scan_state["stats"], result)
+                    scan_state["progress"] += 1
+                    scan_state["current_symbol"] = symbol
+                    scan_changed.notify_all()
+
+        workers = [
+            threading.Thread(target=worker, daemon=True)
+            for _ in range(min(SCAN_WORKERS, len(low_pe_stocks)))
+        ]
+        for thread in workers:
+            thread.start()
+
+        for pos, (_, row) in enumerate(low_pe_stocks.iterrows()):
             pe = row.get("pe") or row.get("criteria_28") or row.get("pe_ratio")
+            work.put((pos, row["symbol"], row.get("name", ""), pe))
+        for _ in workers:
+            work.put(None)
+        for thread in workers:
+            thread.join()
 
-            scan_state["progress"] = idx + 1
-            scan_state["current_symbol"] = symbol
-
-            if symbol in BANK_SYMBOLS:
-                continue
-
-            try:
-                ticker = bp.Ticker(symbol)
-                income_stmt = ticker.get_income_stmt(quarterly=True)
-
-                if income_stmt.empty:
-                    continue
-
-                margins = calculate_net_margin(income_stmt)
-
-                if margins.empty:
-                    continue
-
-                if is_margin_increasing(margins, last_n=quarters):
-                    recent_margins = margins.head(quarters).sort_index()
-                    margin_values = recent_margins.values
-                    margin_quarters = recent_margins.index.tolist()
+        # Screener sırasını koru
+        results = [matches[pos] for pos in sorted(matches)]
 
-                    results.append({
-                        "symbol": symbol,
-                        "name": name,
-                        "pe": pe,
-                        "margin_q1": margin_values[0] if len(margin_values) > 0 else None,
-                        "margin_q2": margin_values[1] if len(margin_values) > 1 else None,
-                        "margin_q3": margin_values[2] if len(margin_values) > 2 else None,
-                        "quarters": " → ".join(margin_quarters),
-                    })
-
-            except Exception:
-                continue
-
-        scan_state["results"] = results
-        scan_state["last_scan"] = datetime.now().strftime("%H:%M:%S")
+        _update_state(results=results, last_scan=datetime.now().strftime("%H:%M:%S"))
 
     except Exception as e:
-        scan_state["error"] = str(e)
+        _update_state(error=str(e))
 
     finally:
-        scan_state["running"] = False
+        _update_state(running=False)
+
+
+# Sayfa şablon değişkeni içermediği için bir kez hazırlanıp olduğu gibi sunulur
+HOME_HTML = HTML_TEMPLATE.encode("utf-8")
+HOME_HTML_GZIP = gzip.compress(HOME_HTML)
 
 
 @app.route("/")
 def home():
-    return render_template_string(HTML_TEMPLATE)
+    if "gzip" in request.accept_encodings:
+        response = Response(HOME_HTML_GZIP, mimetype="text/html")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = Response(HOME_HTML, mimetype="text/html")
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
 
 
 @app.route("/api/scan", methods=["POST"])
@@ -639,6 +822,10 @@ def api_scan():
     quarters = data.get("quarters", 3)
     index = data.get("index") or None
 
+    # Mark as running before the thread starts so stream listeners that
+    # connect right away don't see the previous scan as finished
+    _reset_for_new_scan()
+
     # Start scan in background thread
     thread = threading.Thread(target=run_scan, args=(pe_max, quarters, index))
     thread.daemon = True
@@ -649,7 +836,56 @@ def api_scan():
 
 @app.route("/api/progress")
 def api_progress():
-    return jsonify(scan_state)
+    # Serialize a consistent snapshot instead of the live dict
+    with scan_lock:
+        body = _dumps(scan_state)
+    return Response(body, mimetype="application/json")
+
+
+@app.route("/api/stream")
+def api_stream():
+    """Tarama ilerlemesini Server-Sent Events olarak gönder.
+
+    Tarama sürerken yalnızca değişen ilerleme alanları, bitince tüm sonuçlar
+    tek seferde gönderilir.
+    """
+
+    def progress_key():
+        return (scan_state["progress"], scan_state["total"], scan_state["current_symbol"])
+
+    def generate():
+        last_key = None
+        while True:
+            with scan_changed:
+                scan_changed.wait_for(
+                    lambda seen=last_key: not scan_state["running"] or progress_key() != seen,
+                    timeout=15,
+                )
+                if not scan_state["running"]:
+                    payload = _snapshot_state()
+                else:
+                    key = progress_key()
+                    payload = None
+                    if key != last_key:
+                        last_key = key
+                        payload = {
+                            "running": True,
+                            "progress": key[0],
+                            "total": key[1],
+                            "current_symbol": key[2],
+                            "stats": dict(scan_state["stats"] or {}),
+                        }
+
+            if payload is None:
+                # Keep idle connections alive through proxies
+                yield b": keep-alive\n\n"
+                continue
+
+            yield b"data: " + _dumps(payload) + b"\n\n"
+            if not payload["running"]:
+                return
+
+    return Response(generate(), mimetype="text/event-stream")
 
 
 def main():
@@ -662,7 +898,14 @@ def main():
     print("Durdurmak için Ctrl+C")
     print("=" * 60)
 
-    app.run(debug=False, port=8080)
+    # SSE bağlantıları ve tarama isteklerini eşzamanlı karşılamak için
+    # waitress varsa onu, yoksa Flask'ın çok iş parçacıklı sunucusunu kullan
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(debug=False, port=8080, threaded=True)
+    else:
+        serve(app, host="127.0.0.1", port=8080, threads=8)
 
 
 if __name__ == "__main__":
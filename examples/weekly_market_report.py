@@ -12,19 +12,240 @@ Kullanım:
     python examples/weekly_market_report.py
 """
 
-from datetime import datetime
+import asyncio
+import heapq
+import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from operator import itemgetter
+from pathlib import Path
 
 import pandas as pd
 
 import borsapy as bp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def generate_weekly_report(verbose: bool = True) -> dict:
-    """Haftalık piyasa raporu oluştur."""
+# Yükselen/düşen tablosunun başlık satırı
+MOVERS_HEADER = f"   {'Sembol':<10} {'Fiyat':>10} {'Değişim':>10}"
+
+# Eşzamanlı veri isteği sayısı
+MAX_WORKERS = 16
+
+# Haftalık fiyat geçmişi disk önbelleği (aynı gün içindeki tekrar çalıştırmalar için)
+HISTORY_CACHE_DIR = Path.home() / ".cache" / "borsapy" / "weekly_report"
+
+
+class JsonSectionWriter:
+    """Raporu bölüm bölüm JSON nesnesi olarak dosyaya yazar.
+
+    Her bölüm hesaplandığı anda serileştirilip dosyaya eklenir; tüm rapor
+    bellekte tutulmaz. Virgül ve süslü parantezleri yazıcı yönetir.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file = None
+        self._first = True
+
+    def __enter__(self) -> "JsonSectionWriter":
+        self._file = open(self.path, "wb")
+        self._file.write(b"{")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._file.write(b"\n}\n")
+        self._file.close()
+
+    @staticmethod
+    def _dumps(value) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(
+                value,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                default=str,
+            )
+        return json.dumps(value, ensure_ascii=False, indent=2, default=str).encode("utf-8")
+
+    def write_section(self, key: str, value) -> None:
+        """Bir bölümü `"key": value` olarak dosyaya ekle."""
+        prefix = b"\n  " if self._first else b",\n  "
+        self._first = False
+        body = self._dumps(value).replace(b"\n", b"\n  ")
+        self._file.write(prefix + self._dumps(key) + b": " + body)
+
+
+def _cached_history(kind: str, symbol: str, fetch) -> pd.DataFrame:
+    """Haftalık geçmişi günlük disk önbelleği üzerinden getir.
+
+    Anahtar (tür, sembol, bugünün tarihi) olduğu için her işlem günü bir kez
+    indirilir; aynı gün tekrar çalıştırmalar ağa çıkmaz.
+    """
+    path = HISTORY_CACHE_DIR / f"{kind}_{symbol}_1w_{date.today().isoformat()}.pkl"
+    try:
+        return pd.read_pickle(path)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        pass
+
+    df = fetch()
+    if df is not None and not df.empty:
+        try:
+            HISTORY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            df.to_pickle(path)
+        except OSError:
+            pass
+    return df
+
+
+def _pct_change(df: pd.DataFrame) -> tuple[float, float]:
+    """Son kapanışı ve dönem başına göre yüzde değişimi döndür."""
+    closes = df['Close'].to_numpy()
+    start, end = closes[0], closes[-1]
+    return end, (end - start) / start * 100
+
+
+def _fetch_index(idx: bp.Index) -> dict | None:
+    """Endeksin haftalık değişimini getir."""
+    idx_name = idx.symbol
+    try:
+        df = _cached_history('index', idx_name, lambda: idx.history(period="1w"))
+
+        if df is not None and len(df) > 1:
+            end, change = _pct_change(df)
+
+            return {
+                'index': idx_name,
+                'close': end,
+                'change_pct': change,
+            }
+
+    except Exception:
+        pass
+
+    return None
+
+
+def _fetch_stock(symbol: str) -> dict | None:
+    """Hissenin haftalık değişimini ve hacmini getir."""
+    try:
+        df = _cached_history('stock', symbol, lambda: bp.Ticker(symbol).history(period="1w"))
+
+        if df is not None and len(df) > 1:
+            end, change = _pct_change(df)
+            volume = df['Volume'].to_numpy().sum()
+
+            return {
+                'symbol': symbol,
+                'close': end,
+                'change_pct': change,
+                'volume': float(volume),
+            }
+
+    except Exception:
+        pass
+
+    return None
+
+
+def _fetch_fx(symbol: str, name: str) -> dict | None:
+    """Döviz/emtianın haftalık değişimini getir."""
+    try:
+        df = _cached_history('fx', symbol, lambda: bp.FX(symbol).history(period="1w"))
+
+        if df is not None and len(df) > 1:
+            end, change = _pct_change(df)
+
+            return {
+                'symbol': symbol,
+                'name': name,
+                'close': end,
+                'change_pct': change,
+            }
+
+    except Exception:
+        pass
+
+    return None
+
+
+def _fetch_crypto(symbol: str) -> dict | None:
+    """Kripto paranın anlık fiyatını ve 24 saatlik değişimini getir."""
+    try:
+        info = bp.Crypto(symbol).info
+
+        return {
+            'symbol': symbol,
+            'price': info.get('last', 0),
+            'change_24h': info.get('change_percent', 0),
+        }
+
+    except Exception:
+        return None
+
+
+def _fetch_rates() -> tuple[float, pd.DataFrame]:
+    """TCMB politika faizini ve tahvil faizlerini getir."""
+    return bp.TCMB().policy_rate, bp.bonds()
+
+
+def generate_weekly_report(verbose: bool = True, writer: JsonSectionWriter | None = None) -> dict:
+    """Haftalık piyasa raporu oluştur.
+
+    Tüm veri istekleri bir iş parçacığı havuzunda eşzamanlı yapılır, rapor
+    bölümleri sonuçlar toplandıktan sonra sırayla yazdırılır.
+
+    writer verilirse her bölüm hazır olduğunda doğrudan dosyaya yazılır ve
+    bellekte rapor sözlüğü tutulmaz (dönüş değeri boş sözlüktür).
+    """
 
     report = {}
+
+    def emit(key: str, value) -> None:
+        if writer is not None:
+            writer.write_section(key, value)
+        else:
+            report[key] = value
     report_date = datetime.now().strftime("%d.%m.%Y")
 
+    indices = ['XU100', 'XU030', 'XBANK', 'XUSIN', 'XHOLD']
+    fx_assets = [
+        ('USD', 'Dolar'),
+        ('EUR', 'Euro'),
+        ('GBP', 'Sterlin'),
+        ('gram-altin', 'Gram Altın'),
+    ]
+    cryptos = ['BTCTRY', 'ETHTRY']
+
+    # Endeks nesneleri bir kez oluşturulur; XU100 hem performans hem de
+    # bileşen listesi için aynı nesneden okunur
+    index_objects = {name: bp.Index(name) for name in indices}
+    xu100 = index_objects['XU100']
+
+    # Tüm ağ isteklerini havuzda eşzamanlı çalıştır
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        index_futures = [executor.submit(_fetch_index, idx) for idx in index_objects.values()]
+        fx_futures = [executor.submit(_fetch_fx, symbol, name) for symbol, name in fx_assets]
+        crypto_futures = [executor.submit(_fetch_crypto, symbol) for symbol in cryptos]
+        rates_future = executor.submit(_fetch_rates)
+
+        # XU100 bileşenleri gelince hisse isteklerini de havuza ekle
+        try:
+            symbols = xu100.component_symbols[:30]  # İlk 30 hisse
+            stock_futures = [executor.submit(_fetch_stock, symbol) for symbol in symbols]
+            stocks_error = None
+        except Exception as e:
+            stock_futures = []
+            stocks_error = e
+
+    index_data = [r for r in (f.result() for f in index_futures) if r is not None]
+    stock_changes = [r for r in (f.result() for f in stock_futures) if r is not None]
+    fx_data = [r for r in (f.result() for f in fx_futures) if r is not None]
+    crypto_data = [r for r in (f.result() for f in crypto_futures) if r is not None]
+
     if verbose:
         print("=" * 80)
         print(f"📊 HAFTALIK PİYASA RAPORU - {report_date}")
@@ -36,33 +257,12 @@ def generate_weekly_report(verbose: bool = True) -> dict:
         print("📈 ENDEKS PERFORMANSLARI")
         print("-" * 60)
 
-    indices = ['XU100', 'XU030', 'XBANK', 'XUSIN', 'XHOLD']
-    index_data = []
-
-    for idx_name in indices:
-        try:
-            idx = bp.Index(idx_name)
-            df = idx.history(period="1w")
-
-            if df is not None and len(df) > 1:
-                start = df['Close'].iloc[0]
-                end = df['Close'].iloc[-1]
-                change = ((end - start) / start) * 100
-
-                index_data.append({
-                    'index': idx_name,
-                    'close': end,
-                    'change_pct': change,
-                })
-
-                if verbose:
-                    emoji = "🟢" if change > 0 else "🔴" if change < 0 else "⚪"
-                    print(f"   {idx_name:<10} {end:>10,.2f} {emoji} %{change:>+7.2f}")
-
-        except Exception:
-            pass
+        for item in index_data:
+            change = item['change_pct']
+            emoji = "🟢" if change > 0 else "🔴" if change < 0 else "⚪"
+            print(f"   {item['index']:<10} {item['close']:>10,.2f} {emoji} %{change:>+7.2f}")
 
-    report['indices'] = index_data
+    emit('indices', index_data)
 
     # 2. EN ÇOK YÜKSELENLER/DÜŞENLER
     if verbose:
@@ -71,44 +271,21 @@ def generate_weekly_report(verbose: bool = True) -> dict:
         print("-" * 60)
 
     try:
-        xu100 = bp.Index("XU100")
-        symbols = xu100.component_symbols[:30]  # İlk 30 hisse
-
-        stock_changes = []
-        for symbol in symbols:
-            try:
-                stock = bp.Ticker(symbol)
-                df = stock.history(period="1w")
-
-                if df is not None and len(df) > 1:
-                    start = df['Close'].iloc[0]
-                    end = df['Close'].iloc[-1]
-                    change = ((end - start) / start) * 100
-                    volume = df['Volume'].sum()
-
-                    stock_changes.append({
-                        'symbol': symbol,
-                        'close': end,
-                        'change_pct': change,
-                        'volume': volume,
-                    })
-
-            except Exception:
-                pass
-
-        # Sırala
-        df_stocks = pd.DataFrame(stock_changes)
-        if not df_stocks.empty:
-            df_stocks = df_stocks.sort_values('change_pct', ascending=False)
+        if stocks_error is not None:
+            raise stocks_error
+
+        if stock_changes:
+            # 30 kayıt için DataFrame kurmak yerine doğrudan yığın tabanlı seçim
+            by_change = itemgetter('change_pct')
 
             # En çok yükselenler
-            top_5 = df_stocks.head(5)
+            top_5 = heapq.nlargest(5, stock_changes, key=by_change)
             if verbose:
-                print(f"   {'Sembol':<10} {'Fiyat':>10} {'Değişim':>10}")
-                for _, row in top_5.iterrows():
+                print(MOVERS_HEADER)
+                for row in top_5:
                     print(f"   {row['symbol']:<10} {row['close']:>10.2f} 📈 %{row['change_pct']:>+7.2f}")
 
-            report['top_gainers'] = top_5.to_dict('records')
+            emit('top_gainers', top_5)
 
             # En çok düşenler
             if verbose:
@@ -116,13 +293,13 @@ def generate_weekly_report(verbose: bool = True) -> dict:
                 print("📉 HAFTANIN EN ÇOK DÜŞENLERİ")
                 print("-" * 60)
 
-            bottom_5 = df_stocks.tail(5).iloc[::-1]
+            bottom_5 = heapq.nsmallest(5, stock_changes, key=by_change)
             if verbose:
-                print(f"   {'Sembol':<10} {'Fiyat':>10} {'Değişim':>10}")
-                for _, row in bottom_5.iterrows():
+                print(MOVERS_HEADER)
+                for row in bottom_5:
                     print(f"   {row['symbol']:<10} {row['close']:>10.2f} 📉 %{row['change_pct']:>+7.2f}")
 
-            report['top_losers'] = bottom_5.to_dict('records')
+            emit('top_losers', bottom_5)
 
     except Exception as e:
         if verbose:
@@ -134,40 +311,12 @@ def generate_weekly_report(verbose: bool = True) -> dict:
         print("💱 DÖVİZ VE EMTİA")
         print("-" * 60)
 
-    fx_data = []
-    fx_assets = [
-        ('USD', 'Dolar'),
-        ('EUR', 'Euro'),
-        ('GBP', 'Sterlin'),
-        ('gram-altin', 'Gram Altın'),
-    ]
+        for item in fx_data:
+            change = item['change_pct']
+            emoji = "🟢" if change > 0 else "🔴" if change < 0 else "⚪"
+            print(f"   {item['name']:<15} {item['close']:>12.4f} {emoji} %{change:>+7.2f}")
 
-    for symbol, name in fx_assets:
-        try:
-            fx = bp.FX(symbol)
-            current = fx.current
-            df = fx.history(period="1w")
-
-            if df is not None and len(df) > 1:
-                start = df['Close'].iloc[0]
-                end = df['Close'].iloc[-1]
-                change = ((end - start) / start) * 100
-
-                fx_data.append({
-                    'symbol': symbol,
-                    'name': name,
-                    'close': end,
-                    'change_pct': change,
-                })
-
-                if verbose:
-                    emoji = "🟢" if change > 0 else "🔴" if change < 0 else "⚪"
-                    print(f"   {name:<15} {end:>12.4f} {emoji} %{change:>+7.2f}")
-
-        except Exception:
-            pass
-
-    report['fx'] = fx_data
+    emit('fx', fx_data)
 
     # 4. FAİZ ORANLARI
     if verbose:
@@ -176,24 +325,24 @@ def generate_weekly_report(verbose: bool = True) -> dict:
         print("-" * 60)
 
     try:
-        tcmb = bp.TCMB()
-        policy = tcmb.policy_rate
-
-        bonds = bp.bonds()
+        policy, bonds = rates_future.result()
 
         if verbose:
             print(f"   TCMB Politika Faizi: %{policy:.2f}")
 
             if not bonds.empty:
-                for _, row in bonds.head(3).iterrows():
-                    tenor = row.get('tenor', row.get('maturity', 'N/A'))
-                    rate = row.get('yield', row.get('rate', 0))
+                top_bonds = bonds.head(3)
+                tenor_col = next((c for c in ('tenor', 'maturity') if c in top_bonds), None)
+                rate_col = next((c for c in ('yield', 'rate') if c in top_bonds), None)
+                tenors = top_bonds[tenor_col].to_numpy() if tenor_col else ['N/A'] * len(top_bonds)
+                rates = top_bonds[rate_col].to_numpy() if rate_col else [0] * len(top_bonds)
+                for tenor, rate in zip(tenors, rates, strict=True):
                     print(f"   {tenor} Tahvil: %{rate:.2f}")
 
-        report['rates'] = {
+        emit('rates', {
             'policy_rate': policy,
             'bonds': bonds.head(5).to_dict('records') if not bonds.empty else [],
-        }
+        })
 
     except Exception as e:
         if verbose:
@@ -205,30 +354,13 @@ def generate_weekly_report(verbose: bool = True) -> dict:
         print("₿ KRİPTO PARALAR")
         print("-" * 60)
 
-    crypto_data = []
-    cryptos = ['BTCTRY', 'ETHTRY']
+        for item in crypto_data:
+            price = item['price']
+            change = item['change_24h'] or 0
+            emoji = "🟢" if change > 0 else "🔴" if change < 0 else "⚪"
+            print(f"   {item['symbol']:<10} {price:>15,.2f} TL {emoji} %{change:>+7.2f} (24h)")
 
-    for symbol in cryptos:
-        try:
-            crypto = bp.Crypto(symbol)
-            info = crypto.info
-
-            crypto_data.append({
-                'symbol': symbol,
-                'price': info.get('last', 0),
-                'change_24h': info.get('change_percent', 0),
-            })
-
-            if verbose:
-                price = info.get('last', 0)
-                change = info.get('change_percent', 0) or 0
-                emoji = "🟢" if change > 0 else "🔴" if change < 0 else "⚪"
-                print(f"   {symbol:<10} {price:>15,.2f} TL {emoji} %{change:>+7.2f} (24h)")
-
-        except Exception:
-            pass
-
-    report['crypto'] = crypto_data
+    emit('crypto', crypto_data)
 
     # ÖZET
     if verbose:
@@ -251,14 +383,19 @@ def generate_weekly_report(verbose: bool = True) -> dict:
     return report
 
 
-if __name__ == "__main__":
-    report = generate_weekly_report()
+async def agenerate_weekly_report(verbose: bool = False) -> dict:
+    """generate_weekly_report'un asyncio sürümü.
 
-    # JSON olarak kaydet
-    import json
-    with open("weekly_market_report.json", "w", encoding="utf-8") as f:
-        # DataFrame'leri dict'e çevir
-        json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+    borsapy senkron HTTP istemcileri kullanır; rapor ayrı bir iş parçacığında
+    üretilir, böylece çağıran olay döngüsü (bot, web sunucusu vb.) bloklanmaz.
+    """
+    return await asyncio.to_thread(generate_weekly_report, verbose)
+
+
+if __name__ == "__main__":
+    # Bölümler hesaplandıkça JSON dosyasına yazılır (orjson kuruluysa C kodlayıcıyla)
+    with JsonSectionWriter("weekly_market_report.json") as writer:
+        generate_weekly_report(writer=writer)
 
     print()
     print("📁 Rapor 'weekly_market_report.json' dosyasına kaydedildi.")
@@ -11,6 +11,12 @@ def pytest_configure(config):
         "markers",
         "integration: mark test as integration test (requires network connection)",
     )
+    # Provided by pytest-xdist; registered here so runs without it stay warning-free.
+    # Only takes effect with `pytest -n auto --dist loadgroup`.
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run tests sharing a group on the same xdist worker",
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -28,14 +34,32 @@ def pytest_collection_modifyitems(config, items):
         # Don't skip integration tests
         return
 
-    skip_integration = pytest.mark.skip(
-        reason="Integration test requires --run-integration flag or RUN_INTEGRATION=1"
-    )
+    skip_integration = None
     for item in items:
-        if "integration" in item.keywords:
+        if item.get_closest_marker("integration") is not None:
+            if skip_integration is None:
+                skip_integration = pytest.mark.skip(
+                    reason="Integration test requires --run-integration flag or RUN_INTEGRATION=1"
+                )
             item.add_marker(skip_integration)
 
 
+@pytest.fixture(scope="session")
+def eurobonds_all():
+    """Full Eurobond list, fetched once per test session."""
+    from borsapy.eurobond import eurobonds
+
+    return eurobonds()
+
+
+@pytest.fixture(scope="session")
+def eurobonds_usd():
+    """USD Eurobond list, fetched once per test session."""
+    from borsapy.eurobond import eurobonds
+
+    return eurobonds(currency="USD")
+
+
 def pytest_addoption(parser):
     """Add custom command line options."""
     parser.addoption(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import multiprocessing
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -9,9 +10,20 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from borsapy.backtest import Backtest, BacktestResult, Trade, backtest
+from borsapy.backtest import Backtest, BacktestResult, Trade, backtest, backtest_many
 from borsapy.exceptions import APIError
 
+
+def _rsi_strategy(candle, position, indicators):
+    """Module-level (picklable) RSI strategy for multi-process tests."""
+    rsi = indicators.get("rsi", 50)
+    if rsi < 45 and position is None:
+        return "BUY"
+    elif rsi > 55 and position == "long":
+        return "SELL"
+    return "HOLD"
+
+
 # ============================================================================
 # Trade Tests
 # ============================================================================
@@ -126,7 +138,7 @@ class TestTrade:
 class TestBacktestResult:
     """Tests for BacktestResult dataclass."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_result(self) -> BacktestResult:
         """Create a sample backtest result for testing."""
         dates = pd.date_range("2024-01-01", periods=100, freq="D")
@@ -320,16 +332,18 @@ class TestBacktestResultEdgeCases:
 class TestBacktest:
     """Tests for Backtest class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_history(self) -> pd.DataFrame:
         """Create mock historical data."""
+        rng = np.random.default_rng(0)
         dates = pd.date_range("2024-01-01", periods=100, freq="D")
+        prices = rng.random((4, 100)) * 10 + np.array([[95], [100], [90], [95]])
         data = {
-            "Open": np.random.rand(100) * 10 + 95,
-            "High": np.random.rand(100) * 10 + 100,
-            "Low": np.random.rand(100) * 10 + 90,
-            "Close": np.random.rand(100) * 10 + 95,
-            "Volume": np.random.randint(1000000, 5000000, 100),
+            "Open": prices[0],
+            "High": prices[1],
+            "Low": prices[2],
+            "Close": prices[3],
+            "Volume": rng.integers(1000000, 5000000, 100),
         }
         return pd.DataFrame(data, index=dates)
 
@@ -429,6 +443,35 @@ class TestBacktest:
 
         assert isinstance(result, BacktestResult)
 
+    @patch("borsapy.ticker.Ticker")
+    def test_backtest_vectorized_matches_loop(self, mock_ticker_class, mock_history):
+        """Test vectorized strategy gives the same results as the bar loop."""
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = mock_history
+        mock_ticker_class.return_value = mock_ticker
+
+        def rsi_strategy(candle, position, indicators):
+            rsi = indicators.get("rsi", 50)
+            if rsi < 45 and position is None:
+                return "BUY"
+            elif rsi > 55 and position == "long":
+                return "SELL"
+            return "HOLD"
+
+        def rsi_signals(df):
+            return np.where(df["rsi"] < 45, 1, np.where(df["rsi"] > 55, -1, 0))
+
+        loop = Backtest("THYAO", rsi_strategy, indicators=["rsi"]).run()
+        vec = Backtest("THYAO", rsi_signals, indicators=["rsi"], vectorized=True).run()
+
+        assert loop.total_trades > 0
+        assert vec.total_trades == loop.total_trades
+        for v, lp in zip(vec.trades, loop.trades, strict=True):
+            assert v.entry_time == lp.entry_time
+            assert v.exit_time == lp.exit_time
+            assert v.profit == pytest.approx(lp.profit)
+        np.testing.assert_allclose(vec.equity_curve.values, loop.equity_curve.values)
+
     def test_backtest_invalid_symbol(self):
         """Test backtest with invalid symbol."""
 
@@ -478,6 +521,91 @@ class TestBacktestFunction:
         result = backtest("THYAO", my_strategy, period="1y")
         assert isinstance(result, BacktestResult)
 
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="workers only inherit the mocked Ticker when forked",
+    )
+    @patch("borsapy.bond.risk_free_rate", return_value=0.30)
+    @patch("borsapy.ticker.Ticker")
+    def test_backtest_many_parallel_matches_sequential(self, mock_ticker_class, _mock_rf):
+        """Test backtest_many() gives the same results in parallel and in-process."""
+        symbols = ["THYAO", "GARAN", "ASELS", "AKBNK"]
+        dates = pd.date_range("2024-01-01", periods=100, freq="D")
+        histories = {}
+        for seed, symbol in enumerate(symbols):
+            close = 100 + np.random.default_rng(seed).standard_normal(100).cumsum()
+            histories[symbol] = pd.DataFrame(
+                {"Open": close, "High": close + 1, "Low": close - 1, "Close": close},
+                index=dates,
+            )
+        mock_ticker_class.side_effect = lambda symbol: MagicMock(
+            history=MagicMock(return_value=histories[symbol])
+        )
+
+        sequential = backtest_many(symbols, _rsi_strategy, indicators=["rsi"], max_workers=1)
+        parallel = backtest_many(symbols, _rsi_strategy, indicators=["rsi"], max_workers=4)
+
+        assert list(parallel) == symbols
+        for symbol in symbols:
+            assert parallel[symbol].to_dict() == sequential[symbol].to_dict()
+
+    @patch("borsapy.bond.risk_free_rate", return_value=0.30)
+    @patch("borsapy.ticker.Ticker")
+    def test_backtest_many_dedupes_and_skips_failures(
+        self, mock_ticker_class, _mock_rf, caplog
+    ):
+        """Test backtest_many() runs duplicates once and leaves out failed symbols."""
+        dates = pd.date_range("2024-01-01", periods=100, freq="D")
+        mock_history = pd.DataFrame(
+            {
+                "Open": [100.0] * 100,
+                "High": [105.0] * 100,
+                "Low": [95.0] * 100,
+                "Close": [102.0] * 100,
+            },
+            index=dates,
+        )
+        calls = []
+
+        def make_ticker(symbol):
+            calls.append(symbol)
+            history = pd.DataFrame() if symbol == "EMPTY" else mock_history
+            return MagicMock(history=MagicMock(return_value=history))
+
+        mock_ticker_class.side_effect = make_ticker
+
+        with caplog.at_level("WARNING", logger="borsapy.backtest"):
+            results = backtest_many(
+                ["THYAO", "thyao", "EMPTY", "GARAN"], _rsi_strategy, max_workers=1
+            )
+
+        assert list(results) == ["THYAO", "GARAN"]
+        assert calls == ["THYAO", "EMPTY", "GARAN"]
+        assert "Backtest failed for EMPTY" in caplog.text
+
+    @patch("borsapy.backtest.ProcessPoolExecutor")
+    @patch("borsapy.bond.risk_free_rate", return_value=0.30)
+    @patch("borsapy.ticker.Ticker")
+    def test_backtest_many_unpicklable_strategy_uses_threads(
+        self, mock_ticker_class, _mock_rf, mock_process_pool
+    ):
+        """Test backtest_many() runs a lambda strategy on threads, not processes."""
+        dates = pd.date_range("2024-01-01", periods=100, freq="D")
+        mock_ticker_class.return_value.history.return_value = pd.DataFrame(
+            {
+                "Open": [100.0] * 100,
+                "High": [105.0] * 100,
+                "Low": [95.0] * 100,
+                "Close": [102.0] * 100,
+            },
+            index=dates,
+        )
+
+        results = backtest_many(["THYAO", "GARAN"], lambda c, p, i: "HOLD", max_workers=2)
+
+        assert list(results) == ["THYAO", "GARAN"]
+        mock_process_pool.assert_not_called()
+
 
 # ============================================================================
 # Strategy Edge Cases
@@ -487,7 +615,7 @@ class TestBacktestFunction:
 class TestStrategyEdgeCases:
     """Test edge cases in strategy execution."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_history(self) -> pd.DataFrame:
         """Create mock historical data."""
         dates = pd.date_range("2024-01-01", periods=100, freq="D")
@@ -8,7 +8,7 @@ import pytest
 class TestHeikinAshi:
     """Tests for Heikin Ashi calculations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_ohlc(self):
         """Create sample OHLC data for testing."""
         data = {
@@ -41,31 +41,32 @@ class TestHeikinAshi:
         """Test HA_Close = (O + H + L + C) / 4."""
         from borsapy.charts import calculate_heikin_ashi
 
-        ha = calculate_heikin_ashi(sample_ohlc)
+        ha_close = calculate_heikin_ashi(sample_ohlc)["HA_Close"].to_numpy()
 
         # Check first HA_Close manually
         expected_close_0 = (100 + 105 + 98 + 103) / 4
-        assert np.isclose(ha["HA_Close"].iloc[0], expected_close_0)
+        assert np.isclose(ha_close[0], expected_close_0)
 
     def test_heikin_ashi_first_open(self, sample_ohlc):
         """Test first HA_Open = (Open + Close) / 2."""
         from borsapy.charts import calculate_heikin_ashi
 
-        ha = calculate_heikin_ashi(sample_ohlc)
+        ha_open = calculate_heikin_ashi(sample_ohlc)["HA_Open"].to_numpy()
 
         # First candle: HA_Open = (Open[0] + Close[0]) / 2
         expected_open_0 = (100 + 103) / 2
-        assert np.isclose(ha["HA_Open"].iloc[0], expected_open_0)
+        assert np.isclose(ha_open[0], expected_open_0)
 
     def test_heikin_ashi_subsequent_open(self, sample_ohlc):
         """Test HA_Open[i] = (HA_Open[i-1] + HA_Close[i-1]) / 2."""
         from borsapy.charts import calculate_heikin_ashi
 
         ha = calculate_heikin_ashi(sample_ohlc)
+        ha_open, ha_close = ha[["HA_Open", "HA_Close"]].to_numpy().T
 
         # Second candle: HA_Open[1] = (HA_Open[0] + HA_Close[0]) / 2
-        expected_open_1 = (ha["HA_Open"].iloc[0] + ha["HA_Close"].iloc[0]) / 2
-        assert np.isclose(ha["HA_Open"].iloc[1], expected_open_1)
+        expected_open_1 = (ha_open[0] + ha_close[0]) / 2
+        assert np.isclose(ha_open[1], expected_open_1)
 
     def test_heikin_ashi_high_formula(self, sample_ohlc):
         """Test HA_High = max(High, HA_Open, HA_Close)."""
@@ -74,13 +75,14 @@ class TestHeikinAshi:
         ha = calculate_heikin_ashi(sample_ohlc)
 
         # For each row, HA_High should be the max
-        for i in range(len(ha)):
-            expected_high = max(
-                sample_ohlc["High"].iloc[i],
-                ha["HA_Open"].iloc[i],
-                ha["HA_Close"].iloc[i],
-            )
-            assert np.isclose(ha["HA_High"].iloc[i], expected_high)
+        expected_high = np.maximum.reduce(
+            [
+                sample_ohlc["High"].to_numpy(),
+                ha["HA_Open"].to_numpy(),
+                ha["HA_Close"].to_numpy(),
+            ]
+        )
+        np.testing.assert_allclose(ha["HA_High"].to_numpy(), expected_high)
 
     def test_heikin_ashi_low_formula(self, sample_ohlc):
         """Test HA_Low = min(Low, HA_Open, HA_Close)."""
@@ -89,13 +91,33 @@ class TestHeikinAshi:
         ha = calculate_heikin_ashi(sample_ohlc)
 
         # For each row, HA_Low should be the min
-        for i in range(len(ha)):
-            expected_low = min(
-                sample_ohlc["Low"].iloc[i],
-                ha["HA_Open"].iloc[i],
-                ha["HA_Close"].iloc[i],
-            )
-            assert np.isclose(ha["HA_Low"].iloc[i], expected_low)
+        expected_low = np.minimum.reduce(
+            [
+                sample_ohlc["Low"].to_numpy(),
+                ha["HA_Open"].to_numpy(),
+                ha["HA_Close"].to_numpy(),
+            ]
+        )
+        np.testing.assert_allclose(ha["HA_Low"].to_numpy(), expected_low)
+
+    def test_heikin_ashi_nan_bar(self, sample_ohlc):
+        """Test a NaN bar does not blank out later HA_High/HA_Low (pandas skipna reference)."""
+        from borsapy.charts import calculate_heikin_ashi, calculate_heikin_ashi_bulk
+
+        df = sample_ohlc.astype(float)
+        df.iloc[1, df.columns.get_loc("Open")] = np.nan
+
+        ha = calculate_heikin_ashi(df)
+
+        # Reference: row-wise pandas max/min, which skip NaN
+        expected_high = pd.concat([df["High"], ha["HA_Open"], ha["HA_Close"]], axis=1).max(axis=1)
+        expected_low = pd.concat([df["Low"], ha["HA_Open"], ha["HA_Close"]], axis=1).min(axis=1)
+        np.testing.assert_allclose(ha["HA_High"].to_numpy(), expected_high.to_numpy())
+        np.testing.assert_allclose(ha["HA_Low"].to_numpy(), expected_low.to_numpy())
+        assert np.isfinite(ha[["HA_High", "HA_Low"]].to_numpy()).all()
+
+        bulk = calculate_heikin_ashi_bulk({"NAN": df, "OK": sample_ohlc})
+        pd.testing.assert_frame_equal(bulk["NAN"], ha)
 
     def test_heikin_ashi_volume_preserved(self, sample_ohlc):
         """Test that volume is preserved."""
@@ -154,11 +176,38 @@ class TestHeikinAshi:
 
         pd.testing.assert_index_equal(ha.index, sample_ohlc.index)
 
+    def test_heikin_ashi_float32(self, sample_ohlc):
+        """Test float32 output stays close to the float64 result."""
+        from borsapy.charts import calculate_heikin_ashi
+
+        ha32 = calculate_heikin_ashi(sample_ohlc, dtype=np.float32)
+        ha64 = calculate_heikin_ashi(sample_ohlc)
+
+        cols = ["HA_Open", "HA_High", "HA_Low", "HA_Close"]
+        assert (ha32[cols].dtypes == np.float32).all()
+        np.testing.assert_allclose(ha32[cols].to_numpy(), ha64[cols].to_numpy(), rtol=1e-6)
+
+    def test_heikin_ashi_bulk_matches_single(self, sample_ohlc):
+        """Test bulk calculation matches per-symbol results for mixed lengths."""
+        from borsapy.charts import calculate_heikin_ashi, calculate_heikin_ashi_bulk
+
+        frames = {
+            "LONG": sample_ohlc,
+            "SHORT": sample_ohlc.iloc[:3].drop(columns=["Volume"]),
+            "EMPTY": sample_ohlc.iloc[:0],
+        }
+
+        bulk = calculate_heikin_ashi_bulk(frames)
+
+        assert list(bulk) == ["LONG", "SHORT", "EMPTY"]
+        for symbol, df in frames.items():
+            pd.testing.assert_frame_equal(bulk[symbol], calculate_heikin_ashi(df))
+
 
 class TestTechnicalAnalyzerHeikinAshi:
     """Tests for TechnicalAnalyzer.heikin_ashi()."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def analyzer(self):
         """Create TechnicalAnalyzer with sample data."""
         from borsapy.technical import TechnicalAnalyzer
@@ -228,8 +277,8 @@ class TestHeikinAshiIntegration:
         ha = calculate_heikin_ashi(df)
 
         # HA should have smaller average body size (smoother)
-        abs(df["Close"] - df["Open"]).mean()
-        ha_body = abs(ha["HA_Close"] - ha["HA_Open"]).mean()
+        body = np.subtract(ha["HA_Close"].to_numpy(), ha["HA_Open"].to_numpy())
+        ha_body = np.abs(body, out=body).mean()
 
         # HA bodies are typically smoother (smaller or similar)
         # This is a general property, not guaranteed for all data
@@ -253,5 +302,5 @@ class TestHeikinAshiIntegration:
         ha = calculate_heikin_ashi(df)
 
         # In uptrend, HA candles should mostly have HA_Close > HA_Open (green candles)
-        green_candles = (ha["HA_Close"] > ha["HA_Open"]).sum()
+        green_candles = np.count_nonzero(ha["HA_Close"].to_numpy() > ha["HA_Open"].to_numpy())
         assert green_candles >= 5  # Most candles should be green in uptrend
@@ -10,6 +10,8 @@ from borsapy._providers.ziraat_eurobond import ZiraatEurobondProvider
 from borsapy.eurobond import Eurobond, _parse_date_arg, eurobonds
 from borsapy.exceptions import DataNotAvailableError
 
+VALID_CCY = frozenset({"USD", "EUR"})
+
 # =============================================================================
 # Eurobonds Function Tests
 # =============================================================================
@@ -48,13 +50,13 @@ class TestEurobondsFunction:
         """Test filtering by USD currency."""
         df = eurobonds(currency="USD")
         if not df.empty:
-            assert all(df["currency"] == "USD")
+            assert (df["currency"] == "USD").all()
 
     def test_currency_filter_eur(self):
         """Test filtering by EUR currency."""
         df = eurobonds(currency="EUR")
         if not df.empty:
-            assert all(df["currency"] == "EUR")
+            assert (df["currency"] == "EUR").all()
 
     def test_sorted_by_maturity(self):
         """Test DataFrame is sorted by maturity."""
@@ -69,16 +71,58 @@ class TestEurobondsFunction:
 # =============================================================================
 
 
+MOCK_EUROBONDS = [
+    {
+        "isin": "US900123DG28",
+        "maturity": datetime(2033, 1, 19),
+        "days_to_maturity": 2562,
+        "currency": "USD",
+        "bid_price": 120.26,
+        "bid_yield": 6.55,
+        "ask_price": 122.19,
+        "ask_yield": 6.24,
+    },
+    {
+        "isin": "XS2726335099",
+        "maturity": datetime(2030, 7, 6),
+        "days_to_maturity": 1540,
+        "currency": "EUR",
+        "bid_price": 104.85,
+        "bid_yield": 4.91,
+        "ask_price": 105.60,
+        "ask_yield": 4.73,
+    },
+]
+
+
+@pytest.fixture(scope="class")
+def mock_eurobond_provider():
+    """Serve MOCK_EUROBONDS instead of the Ziraat API for one test class."""
+    by_isin = {bond["isin"]: bond for bond in MOCK_EUROBONDS}
+    provider = Mock(spec=ZiraatEurobondProvider)
+    provider.get_eurobonds.return_value = MOCK_EUROBONDS
+    provider.get_eurobond.side_effect = lambda isin: by_isin.get(isin.upper())
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("borsapy.eurobond.get_eurobond_provider", lambda: provider)
+        yield provider
+
+
+@pytest.fixture(scope="class")
+def sample_isin():
+    """A valid ISIN from the canned data."""
+    return MOCK_EUROBONDS[0]["isin"]
+
+
+@pytest.fixture(scope="class")
+def bond(mock_eurobond_provider, sample_isin):
+    """Shared Eurobond for read-only property tests."""
+    return Eurobond(sample_isin)
+
+
+@pytest.mark.usefixtures("mock_eurobond_provider")
 class TestEurobondClass:
-    """Tests for Eurobond class."""
-
-    @pytest.fixture
-    def sample_isin(self):
-        """Get a valid ISIN from the list for testing."""
-        df = eurobonds()
-        if df.empty:
-            pytest.skip("No Eurobond data available")
-        return df.iloc[0]["isin"]
+    """Tests for Eurobond class (canned provider data, no network)."""
 
     def test_create_by_isin(self, sample_isin):
         """Test creating Eurobond by ISIN."""
@@ -90,45 +134,28 @@ class TestEurobondClass:
         bond = Eurobond(sample_isin.lower())
         assert bond.isin == sample_isin.upper()
 
-    def test_maturity_type(self, sample_isin):
-        """Test maturity is datetime or None."""
-        bond = Eurobond(sample_isin)
-        assert bond.maturity is None or isinstance(bond.maturity, datetime)
-
-    def test_days_to_maturity_type(self, sample_isin):
-        """Test days_to_maturity is int."""
-        bond = Eurobond(sample_isin)
-        assert isinstance(bond.days_to_maturity, int)
-
-    def test_currency_type(self, sample_isin):
-        """Test currency is string."""
-        bond = Eurobond(sample_isin)
-        assert isinstance(bond.currency, str)
-        assert bond.currency in ["USD", "EUR"]
-
-    def test_bid_price_type(self, sample_isin):
-        """Test bid_price is float or None."""
-        bond = Eurobond(sample_isin)
-        assert bond.bid_price is None or isinstance(bond.bid_price, float)
-
-    def test_bid_yield_type(self, sample_isin):
-        """Test bid_yield is float or None."""
-        bond = Eurobond(sample_isin)
-        assert bond.bid_yield is None or isinstance(bond.bid_yield, float)
-
-    def test_ask_price_type(self, sample_isin):
-        """Test ask_price is float or None."""
-        bond = Eurobond(sample_isin)
-        assert bond.ask_price is None or isinstance(bond.ask_price, float)
-
-    def test_ask_yield_type(self, sample_isin):
-        """Test ask_yield is float or None."""
-        bond = Eurobond(sample_isin)
-        assert bond.ask_yield is None or isinstance(bond.ask_yield, float)
-
-    def test_info_returns_dict(self, sample_isin):
+    @pytest.mark.parametrize(
+        "attr, types",
+        [
+            ("maturity", (datetime, type(None))),
+            ("days_to_maturity", (int,)),
+            ("currency", (str,)),
+            ("bid_price", (float, type(None))),
+            ("bid_yield", (float, type(None))),
+            ("ask_price", (float, type(None))),
+            ("ask_yield", (float, type(None))),
+        ],
+    )
+    def test_attr_type(self, bond, attr, types):
+        """Test each bond property has the documented type."""
+        assert isinstance(getattr(bond, attr), types)
+
+    def test_currency_value(self, bond):
+        """Test currency is USD or EUR."""
+        assert bond.currency in VALID_CCY
+
+    def test_info_returns_dict(self, bond):
         """Test info returns dict with all data."""
-        bond = Eurobond(sample_isin)
         info = bond.info
         assert isinstance(info, dict)
         assert "isin" in info
@@ -136,17 +163,15 @@ class TestEurobondClass:
         assert "currency" in info
         assert "bid_yield" in info
 
-    def test_info_is_copy(self, sample_isin):
+    def test_info_is_copy(self, bond):
         """Test info returns a copy (modifying doesn't affect original)."""
-        bond = Eurobond(sample_isin)
         info1 = bond.info
         info1["test"] = "value"
         info2 = bond.info
         assert "test" not in info2
 
-    def test_repr(self, sample_isin):
+    def test_repr(self, bond, sample_isin):
         """Test string representation."""
-        bond = Eurobond(sample_isin)
         repr_str = repr(bond)
         assert "Eurobond" in repr_str
         assert sample_isin in repr_str
@@ -157,34 +182,47 @@ class TestEurobondClass:
             bond = Eurobond("INVALID_ISIN_123")
             _ = bond.isin  # Access property to trigger data load
 
+    @pytest.mark.parametrize(
+        "isin", ["INVALID_ISIN_123", "US900123DG2", "US900123DG28X", "US900123-G28"]
+    )
+    def test_malformed_isin_skips_lookup(self, mock_eurobond_provider, isin):
+        """Test malformed ISINs are rejected before querying the provider."""
+        mock_eurobond_provider.get_eurobond.reset_mock()
+        with pytest.raises(DataNotAvailableError, match="Invalid ISIN"):
+            Eurobond(isin)
+        mock_eurobond_provider.get_eurobond.assert_not_called()
+
 
 # =============================================================================
 # Integration Tests
 # =============================================================================
 
 
+@pytest.mark.integration
+@pytest.mark.xdist_group(name="eurobonds")
 class TestEurobondIntegration:
     """Integration tests with real API calls."""
 
-    def test_usd_bonds_exist(self):
+    def test_usd_bonds_exist(self, eurobonds_usd):
         """Test there are USD denominated bonds."""
-        df = eurobonds(currency="USD")
+        df = eurobonds_usd
         assert len(df) > 0, "Expected USD Eurobonds"
 
-    def test_yield_reasonable_range(self):
+    def test_yield_reasonable_range(self, eurobonds_all):
         """Test yields are in reasonable range."""
-        df = eurobonds()
+        df = eurobonds_all
         if not df.empty and df["bid_yield"].notna().any():
             yields = df["bid_yield"].dropna()
             # Skip if all yields are 0 (data source may be unavailable)
             if (yields == 0).all():
                 pytest.skip("All yields are 0 - data source may be unavailable")
             valid_yields = yields[yields > 0]
-            assert all(0 < y < 50 for y in valid_yields), "Yields seem unreasonable"
+            arr = valid_yields.to_numpy()
+            assert ((arr > 0) & (arr < 50)).all(), "Yields seem unreasonable"
 
-    def test_days_to_maturity_positive(self):
+    def test_days_to_maturity_positive(self, eurobonds_all):
         """Test all bonds have positive days to maturity."""
-        df = eurobonds()
+        df = eurobonds_all
         if not df.empty:
             # Filter out any with 0 (could be data issues)
             valid = df[df["days_to_maturity"] > 0]
@@ -330,6 +368,24 @@ class TestGetHistoryWithMockProvider:
         assert rows == []
 
 
+class TestGetEurobondIndex:
+    """Provider.get_eurobond looks bonds up through a cached ISIN index."""
+
+    def test_lookup_and_refresh(self):
+        provider = ZiraatEurobondProvider()
+        first = [dict(b) for b in MOCK_EUROBONDS]
+        provider.get_eurobonds = Mock(return_value=first)
+
+        assert provider.get_eurobond("us900123dg28") is first[0]
+        assert provider.get_eurobond("XS2726335099") is first[1]
+        assert provider.get_eurobond("XX0000000000") is None
+
+        refreshed = [dict(MOCK_EUROBONDS[0], bid_yield=7.0)]
+        provider.get_eurobonds.return_value = refreshed
+        assert provider.get_eurobond("US900123DG28")["bid_yield"] == 7.0
+        assert provider.get_eurobond("XS2726335099") is None
+
+
 class TestEurobondHistoryMocked:
     """Eurobond.history() integrates period/start/end resolution."""
 
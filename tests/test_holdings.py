@@ -1,11 +1,12 @@
 """Tests for Fund holdings functionality."""
 
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pandas as pd
 import pytest
 
+from borsapy import Fund
 from borsapy._providers.kap_holdings import (
     Holding,
     KAPHoldingsProvider,
@@ -15,6 +16,37 @@ from borsapy._providers.kap_holdings import (
 # Test API key (for integration tests)
 TEST_API_KEY = os.environ.get("OPENROUTER_API_KEY", "")
 
+VALID_HOLDING_TYPES = frozenset(
+    {"stock", "etf", "fund", "viop", "viop_cash", "term_deposit", "reverse_repo"}
+)
+
+
+def _h(symbol, isin=None, name="X", weight=1.0, ht="stock"):
+    """Build a Holding with only the fields deduplication cares about."""
+    return Holding(symbol, isin, name, weight, ht)
+
+
+@pytest.fixture(scope="module")
+def yay_fund():
+    """Shared YAY Fund instance for the holdings tests."""
+    return Fund("YAY")
+
+
+@pytest.fixture(scope="module")
+def mock_holdings_df():
+    """Minimal holdings DataFrame returned by mocked providers."""
+    return pd.DataFrame({"symbol": ["TEST"], "weight": [1.0]})
+
+
+@pytest.fixture
+def mock_kap_provider(monkeypatch):
+    """Stub KAP holdings provider returned by get_kap_holdings_provider()."""
+    stub = MagicMock()
+    monkeypatch.setattr(
+        "borsapy._providers.kap_holdings.get_kap_holdings_provider", lambda: stub
+    )
+    return stub
+
 
 class TestHolding:
     """Tests for Holding dataclass."""
@@ -70,9 +102,9 @@ class TestKAPHoldingsProvider:
         provider = KAPHoldingsProvider()
 
         holdings = [
-            Holding("GOOGL", "US02079K3059", "Alphabet", 6.76, "stock"),
-            Holding("GOOG", "US02079K3059", "Alphabet", 6.76, "stock"),  # Same ISIN
-            Holding("MSFT", "US5949181045", "Microsoft", 5.00, "stock"),
+            _h("GOOGL", "US02079K3059"),
+            _h("GOOG", "US02079K3059"),  # Same ISIN
+            _h("MSFT", "US5949181045"),
         ]
 
         result = provider._deduplicate_holdings(holdings)
@@ -86,9 +118,9 @@ class TestKAPHoldingsProvider:
         provider = KAPHoldingsProvider()
 
         holdings = [
-            Holding("YAY", None, "YAY Fund 1", 1.0, "fund"),
-            Holding("YAY", None, "YAY Fund 2", 1.0, "fund"),  # Same symbol
-            Holding("AAK", None, "AAK Fund", 2.0, "fund"),
+            _h("YAY", ht="fund"),
+            _h("YAY", ht="fund"),  # Same symbol
+            _h("AAK", ht="fund"),
         ]
 
         result = provider._deduplicate_holdings(holdings)
@@ -97,6 +129,33 @@ class TestKAPHoldingsProvider:
         assert result[0].symbol == "YAY"
         assert result[1].symbol == "AAK"
 
+    def test_get_disclosures_cached(self):
+        """Test disclosures are fetched once per fund and period until cleared."""
+        provider = KAPHoldingsProvider()
+        provider._fund_id_cache["YAY"] = "A" * 32
+        response = Mock()
+        response.json.return_value = [{"disclosureBasic": {"disclosureIndex": 1}}]
+
+        with patch.object(provider._client, "get", return_value=response) as mock_get:
+            first = provider.get_disclosures("yay")
+            second = provider.get_disclosures("YAY")
+            assert mock_get.call_count == 1
+            assert second == first
+
+            # Mutating a returned list or its dicts leaves the cache intact
+            first[0]["title"] = "changed"
+            first.clear()
+            assert provider.get_disclosures("YAY") == second
+            assert mock_get.call_count == 1
+
+            provider.get_disclosures("YAY", days=30)
+            assert mock_get.call_count == 2
+
+            provider.clear_cache()
+            provider._fund_id_cache["YAY"] = "A" * 32
+            provider.get_disclosures("YAY")
+            assert mock_get.call_count == 3
+
     def test_get_holdings_df_empty(self):
         """Test get_holdings_df with empty holdings."""
         provider = KAPHoldingsProvider()
@@ -135,45 +194,45 @@ class TestKAPHoldingsProvider:
         assert df.iloc[1]["symbol"] == "MSFT"
         assert df.iloc[1]["weight"] == 5.00
 
+    def test_get_holdings_batch(self):
+        """Test get_holdings_batch returns one DataFrame per unique fund code."""
+        provider = KAPHoldingsProvider()
 
-class TestFundHoldings:
-    """Tests for Fund.get_holdings integration."""
+        def fake_holdings_df(code, api_key, period=None):
+            return pd.DataFrame({"symbol": [code], "weight": [1.0]})
 
-    def test_fund_get_holdings_method(self):
-        """Test Fund.get_holdings() method with api_key."""
-        from borsapy import Fund
+        with patch.object(
+            provider, "get_holdings_df", side_effect=fake_holdings_df
+        ) as mock_df:
+            result = provider.get_holdings_batch(["yay", "AAK", "YAY"], "fake-api-key")
 
-        mock_df = pd.DataFrame({"symbol": ["TEST"], "weight": [1.0]})
+        assert list(result) == ["YAY", "AAK"]
+        assert result["AAK"].iloc[0]["symbol"] == "AAK"
+        assert mock_df.call_count == 2
 
-        with patch(
-            "borsapy._providers.kap_holdings.get_kap_holdings_provider"
-        ) as mock_provider:
-            mock_provider.return_value.get_holdings_df.return_value = mock_df
 
-            fund = Fund("YAY")
-            fund.get_holdings(api_key="test-api-key")
+class TestFundHoldings:
+    """Tests for Fund.get_holdings integration."""
 
-            mock_provider.return_value.get_holdings_df.assert_called_once_with(
-                "YAY", "test-api-key", period=None
-            )
+    def test_fund_get_holdings_method(self, yay_fund, mock_holdings_df, mock_kap_provider):
+        """Test Fund.get_holdings() method with api_key."""
+        mock_kap_provider.get_holdings_df.return_value = mock_holdings_df
 
-    def test_fund_get_holdings_with_period(self):
-        """Test Fund.get_holdings() method with period."""
-        from borsapy import Fund
+        yay_fund.get_holdings(api_key="test-api-key")
 
-        mock_df = pd.DataFrame({"symbol": ["TEST"], "weight": [1.0]})
+        mock_kap_provider.get_holdings_df.assert_called_once_with(
+            "YAY", "test-api-key", period=None
+        )
 
-        with patch(
-            "borsapy._providers.kap_holdings.get_kap_holdings_provider"
-        ) as mock_provider:
-            mock_provider.return_value.get_holdings_df.return_value = mock_df
+    def test_fund_get_holdings_with_period(self, yay_fund, mock_holdings_df, mock_kap_provider):
+        """Test Fund.get_holdings() method with period."""
+        mock_kap_provider.get_holdings_df.return_value = mock_holdings_df
 
-            fund = Fund("YAY")
-            fund.get_holdings(api_key="test-api-key", period="2025-01")
+        yay_fund.get_holdings(api_key="test-api-key", period="2025-01")
 
-            mock_provider.return_value.get_holdings_df.assert_called_once_with(
-                "YAY", "test-api-key", period="2025-01"
-            )
+        mock_kap_provider.get_holdings_df.assert_called_once_with(
+            "YAY", "test-api-key", period="2025-01"
+        )
 
 
 @pytest.mark.integration
@@ -181,12 +240,9 @@ class TestHoldingsIntegration:
     """Integration tests for holdings (require network and API key)."""
 
     @pytest.mark.skipif(not TEST_API_KEY, reason="OPENROUTER_API_KEY not set")
-    def test_fund_holdings_real(self):
+    def test_fund_holdings_real(self, yay_fund):
         """Test fetching real fund holdings from KAP using LLM."""
-        from borsapy import Fund
-
-        fund = Fund("YAY")
-        holdings = fund.get_holdings(api_key=TEST_API_KEY)
+        holdings = yay_fund.get_holdings(api_key=TEST_API_KEY)
 
         # Basic checks
         assert isinstance(holdings, pd.DataFrame)
@@ -200,16 +256,12 @@ class TestHoldingsIntegration:
         assert 90 < total_weight <= 110
 
         # Should have valid holding types
-        valid_types = ["stock", "etf", "fund", "viop", "viop_cash", "term_deposit", "reverse_repo"]
-        assert holdings["type"].isin(valid_types).all()
+        assert holdings["type"].isin(VALID_HOLDING_TYPES).all()
 
     @pytest.mark.skipif(not TEST_API_KEY, reason="OPENROUTER_API_KEY not set")
-    def test_fund_get_holdings_with_period(self):
+    def test_fund_get_holdings_with_period(self, yay_fund):
         """Test fetching holdings for a specific period."""
-        from borsapy import Fund
-
-        fund = Fund("YAY")
-        holdings = fund.get_holdings(api_key=TEST_API_KEY, period="2024-12")
+        holdings = yay_fund.get_holdings(api_key=TEST_API_KEY, period="2024-12")
 
         # May be empty if no disclosure for that period
         assert isinstance(holdings, pd.DataFrame)
@@ -234,23 +286,22 @@ class TestHoldingsIntegration:
     @pytest.mark.skipif(not TEST_API_KEY, reason="OPENROUTER_API_KEY not set")
     def test_multiple_fund_types(self):
         """Test parsing different fund types with LLM."""
-        from borsapy import Fund
-
         fund_codes = ["YAY", "MAC", "GAF", "AAK", "TTE"]
 
-        for code in fund_codes:
-            try:
-                fund = Fund(code)
-                holdings = fund.get_holdings(api_key=TEST_API_KEY)
+        provider = get_kap_holdings_provider()
+        try:
+            results = provider.get_holdings_batch(fund_codes, TEST_API_KEY)
+        except Exception as e:
+            pytest.fail(f"Batch holdings failed with error: {e}")
 
-                assert isinstance(holdings, pd.DataFrame), f"{code}: Should return DataFrame"
+        assert list(results) == fund_codes
 
-                if len(holdings) > 0:
-                    total_weight = holdings["weight"].sum()
-                    print(f"{code}: {len(holdings)} holdings, {total_weight:.2f}% total weight")
+        for code, holdings in results.items():
+            assert isinstance(holdings, pd.DataFrame), f"{code}: Should return DataFrame"
 
-                    # LLM should achieve high coverage
-                    assert total_weight > 80, f"{code}: Weight too low ({total_weight:.2f}%)"
+            if len(holdings) > 0:
+                total_weight = holdings["weight"].sum()
+                print(f"{code}: {len(holdings)} holdings, {total_weight:.2f}% total weight")
 
-            except Exception as e:
-                pytest.fail(f"{code}: Failed with error: {e}")
+                # LLM should achieve high coverage
+                assert total_weight > 80, f"{code}: Weight too low ({total_weight:.2f}%)"
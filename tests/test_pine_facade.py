@@ -16,80 +16,81 @@ from borsapy._providers.pine_facade import (
 from borsapy.exceptions import AuthenticationError, DataNotAvailableError
 
 
-class TestStandardIndicatorsMapping:
-    """Test STANDARD_INDICATORS constant."""
+@pytest.fixture(autouse=True)
+def _reset_cache():
+    """Start and finish every test with an empty indicator cache."""
+    clear_indicator_cache()
+    yield
+    clear_indicator_cache()
+
+
+@pytest.fixture(scope="module")
+def provider():
+    """Shared provider; tests that stub the client go through monkeypatch."""
+    return PineFacadeProvider()
 
-    def test_rsi_mapping(self):
-        """RSI should map to STD;RSI."""
-        assert STANDARD_INDICATORS["RSI"] == "STD;RSI"
 
-    def test_macd_mapping(self):
-        """MACD should map to STD;MACD."""
-        assert STANDARD_INDICATORS["MACD"] == "STD;MACD"
+@pytest.fixture(scope="module")
+def ok_response():
+    """Read-only happy-path Pine Facade response with no inputs or plots."""
+    response = MagicMock()
+    response.json.return_value = {"inputs": [], "plots": []}
+    return response
 
-    def test_bollinger_aliases(self):
-        """Both BB and BOLLINGER should map to STD;BB."""
-        assert STANDARD_INDICATORS["BB"] == "STD;BB"
-        assert STANDARD_INDICATORS["BOLLINGER"] == "STD;BB"
 
-    def test_stochastic_aliases(self):
-        """Both STOCHASTIC and STOCH should map to STD;Stochastic."""
-        assert STANDARD_INDICATORS["STOCHASTIC"] == "STD;Stochastic"
-        assert STANDARD_INDICATORS["STOCH"] == "STD;Stochastic"
+@pytest.fixture
+def mock_get(provider, monkeypatch, ok_response):
+    """Stub provider._client.get to return ok_response for one test."""
+    get = MagicMock(return_value=ok_response)
+    monkeypatch.setattr(provider._client, "get", get)
+    return get
 
-    def test_moving_averages(self):
-        """EMA and SMA should be mapped."""
-        assert STANDARD_INDICATORS["EMA"] == "STD;EMA"
-        assert STANDARD_INDICATORS["SMA"] == "STD;SMA"
 
-    def test_all_standard_indicators_have_std_prefix(self):
+class TestStandardIndicatorsMapping:
+    """Test STANDARD_INDICATORS constant."""
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("RSI", "STD;RSI"),
+            ("MACD", "STD;MACD"),
+            ("BB", "STD;BB"),
+            ("BOLLINGER", "STD;BB"),
+            ("STOCHASTIC", "STD;Stochastic"),
+            ("STOCH", "STD;Stochastic"),
+            ("EMA", "STD;EMA"),
+            ("SMA", "STD;SMA"),
+        ],
+    )
+    def test_mapping(self, name, expected):
+        """Short names and aliases should map to their STD; IDs."""
+        assert STANDARD_INDICATORS[name] == expected
+
+    @pytest.mark.parametrize("name", sorted(STANDARD_INDICATORS))
+    def test_all_standard_indicators_have_std_prefix(self, name):
         """All standard indicators should start with STD;."""
-        for name, indicator_id in STANDARD_INDICATORS.items():
-            assert indicator_id.startswith("STD;"), f"{name} should start with STD;"
+        assert STANDARD_INDICATORS[name].startswith("STD;")
 
 
 class TestIndicatorOutputsMapping:
     """Test INDICATOR_OUTPUTS constant."""
 
-    def test_rsi_outputs(self):
-        """RSI should have single 'value' output."""
-        assert "STD;RSI" in INDICATOR_OUTPUTS
-        assert INDICATOR_OUTPUTS["STD;RSI"] == {"plot_0": "value"}
-
-    def test_macd_outputs(self):
-        """MACD should have macd, signal, histogram outputs."""
-        assert "STD;MACD" in INDICATOR_OUTPUTS
-        outputs = INDICATOR_OUTPUTS["STD;MACD"]
-        assert outputs["plot_0"] == "macd"
-        assert outputs["plot_1"] == "signal"
-        assert outputs["plot_2"] == "histogram"
-
-    def test_bollinger_outputs(self):
-        """Bollinger Bands should have middle, upper, lower outputs."""
-        assert "STD;BB" in INDICATOR_OUTPUTS
-        outputs = INDICATOR_OUTPUTS["STD;BB"]
-        assert outputs["plot_0"] == "middle"
-        assert outputs["plot_1"] == "upper"
-        assert outputs["plot_2"] == "lower"
-
-    def test_stochastic_outputs(self):
-        """Stochastic should have k and d outputs."""
-        assert "STD;Stochastic" in INDICATOR_OUTPUTS
-        outputs = INDICATOR_OUTPUTS["STD;Stochastic"]
-        assert outputs["plot_0"] == "k"
-        assert outputs["plot_1"] == "d"
-
-    def test_adx_outputs(self):
-        """ADX should have adx, plus_di, minus_di outputs."""
-        assert "STD;ADX" in INDICATOR_OUTPUTS
-        outputs = INDICATOR_OUTPUTS["STD;ADX"]
-        assert outputs["plot_0"] == "adx"
-        assert outputs["plot_1"] == "plus_di"
-        assert outputs["plot_2"] == "minus_di"
-
-    def test_single_value_indicators(self):
-        """Indicators with single output should map to 'value'."""
-        single_value_indicators = [
+    @pytest.mark.parametrize(
+        "indicator_id, expected",
+        [
+            ("STD;MACD", {"plot_0": "macd", "plot_1": "signal", "plot_2": "histogram"}),
+            ("STD;BB", {"plot_0": "middle", "plot_1": "upper", "plot_2": "lower"}),
+            ("STD;Stochastic", {"plot_0": "k", "plot_1": "d"}),
+            ("STD;ADX", {"plot_0": "adx", "plot_1": "plus_di", "plot_2": "minus_di"}),
+        ],
+    )
+    def test_multi_output_indicators(self, indicator_id, expected):
+        """Multi-output indicators should name each plot."""
+        assert INDICATOR_OUTPUTS[indicator_id] == expected
+
+    @pytest.mark.parametrize(
+        "indicator_id",
+        [
             "STD;RSI",
             "STD;EMA",
             "STD;SMA",
@@ -100,23 +101,22 @@ class TestIndicatorOutputsMapping:
             "STD;MFI",
             "STD;ROC",
             "STD;CMF",
-        ]
-        for indicator_id in single_value_indicators:
-            assert indicator_id in INDICATOR_OUTPUTS
-            assert INDICATOR_OUTPUTS[indicator_id] == {"plot_0": "value"}
+        ],
+    )
+    def test_single_value_indicators(self, indicator_id):
+        """Indicators with single output should map to 'value'."""
+        assert INDICATOR_OUTPUTS[indicator_id] == {"plot_0": "value"}
 
 
 class TestPineFacadeProviderInit:
     """Test PineFacadeProvider initialization."""
 
-    def test_provider_creation(self):
+    def test_provider_creation(self, provider):
         """Provider should be created with correct base URL."""
-        provider = PineFacadeProvider()
         assert provider.BASE_URL == "https://pine-facade.tradingview.com/pine-facade"
 
-    def test_provider_timeout(self):
+    def test_provider_timeout(self, provider):
         """Provider should have 15 second timeout."""
-        provider = PineFacadeProvider()
         # Timeout is set in __init__
         assert provider._client.timeout.read == 15.0
 
@@ -124,33 +124,25 @@ class TestPineFacadeProviderInit:
 class TestNormalizeIndicatorId:
     """Test _normalize_indicator_id method."""
 
-    def test_short_name_to_full_id(self):
+    def test_short_name_to_full_id(self, provider):
         """Short name should be normalized to full ID."""
-        provider = PineFacadeProvider()
-
         assert provider._normalize_indicator_id("RSI") == "STD;RSI"
         assert provider._normalize_indicator_id("MACD") == "STD;MACD"
         assert provider._normalize_indicator_id("BB") == "STD;BB"
 
-    def test_lowercase_short_name(self):
+    def test_lowercase_short_name(self, provider):
         """Lowercase short name should be normalized correctly."""
-        provider = PineFacadeProvider()
-
         assert provider._normalize_indicator_id("rsi") == "STD;RSI"
         assert provider._normalize_indicator_id("macd") == "STD;MACD"
 
-    def test_full_id_unchanged(self):
+    def test_full_id_unchanged(self, provider):
         """Full ID should remain unchanged."""
-        provider = PineFacadeProvider()
-
         assert provider._normalize_indicator_id("STD;RSI") == "STD;RSI"
         assert provider._normalize_indicator_id("PUB;abc123") == "PUB;abc123"
         assert provider._normalize_indicator_id("USER;xyz789") == "USER;xyz789"
 
-    def test_unknown_name_gets_std_prefix(self):
+    def test_unknown_name_gets_std_prefix(self, provider):
         """Unknown indicator name should get STD; prefix."""
-        provider = PineFacadeProvider()
-
         assert provider._normalize_indicator_id("Unknown") == "STD;Unknown"
         assert provider._normalize_indicator_id("CustomInd") == "STD;CustomInd"
 
@@ -158,25 +150,19 @@ class TestNormalizeIndicatorId:
 class TestNeedsAuth:
     """Test _needs_auth method."""
 
-    def test_standard_indicators_no_auth(self):
+    def test_standard_indicators_no_auth(self, provider):
         """Standard indicators (STD;*) should not require auth."""
-        provider = PineFacadeProvider()
-
         assert provider._needs_auth("STD;RSI") is False
         assert provider._needs_auth("STD;MACD") is False
         assert provider._needs_auth("STD;BB") is False
 
-    def test_public_indicators_need_auth(self):
+    def test_public_indicators_need_auth(self, provider):
         """Public indicators (PUB;*) should require auth."""
-        provider = PineFacadeProvider()
-
         assert provider._needs_auth("PUB;abc123") is True
         assert provider._needs_auth("PUB;xyz789") is True
 
-    def test_user_indicators_need_auth(self):
+    def test_user_indicators_need_auth(self, provider):
         """User indicators (USER;*) should require auth."""
-        provider = PineFacadeProvider()
-
         assert provider._needs_auth("USER;abc123") is True
         assert provider._needs_auth("USER;xyz789") is True
 
@@ -184,37 +170,31 @@ class TestNeedsAuth:
 class TestGetAuthCookies:
     """Test _get_auth_cookies method."""
 
-    def test_explicit_session_and_signature(self):
+    def test_explicit_session_and_signature(self, provider):
         """Explicit session and signature should be used."""
-        provider = PineFacadeProvider()
-
         result = provider._get_auth_cookies("my_session", "my_signature")
 
         assert result == {"sessionid": "my_session", "sessionid_sign": "my_signature"}
 
-    def test_explicit_session_only(self):
+    def test_explicit_session_only(self, provider):
         """Session only should return empty signature."""
-        provider = PineFacadeProvider()
-
         result = provider._get_auth_cookies("my_session", None)
 
         assert result == {"sessionid": "my_session", "sessionid_sign": ""}
 
     @patch("borsapy._providers.pine_facade.get_tradingview_auth")
-    def test_global_auth_used_when_no_explicit(self, mock_auth):
+    def test_global_auth_used_when_no_explicit(self, mock_auth, provider):
         """Global auth should be used when no explicit credentials provided."""
         mock_auth.return_value = {"session": "global_session", "session_sign": "global_sign"}
-        provider = PineFacadeProvider()
 
         result = provider._get_auth_cookies(None, None)
 
         assert result == {"sessionid": "global_session", "sessionid_sign": "global_sign"}
 
     @patch("borsapy._providers.pine_facade.get_tradingview_auth")
-    def test_empty_when_no_auth(self, mock_auth):
+    def test_empty_when_no_auth(self, mock_auth, provider):
         """Empty values should be returned when no auth available."""
         mock_auth.return_value = None
-        provider = PineFacadeProvider()
 
         result = provider._get_auth_cookies(None, None)
 
@@ -224,9 +204,8 @@ class TestGetAuthCookies:
 class TestParseIndicatorResponse:
     """Test _parse_indicator_response method."""
 
-    def test_basic_response_parsing(self):
+    def test_basic_response_parsing(self, provider):
         """Basic response should be parsed correctly."""
-        provider = PineFacadeProvider()
         data = {
             "version": "v5",
             "inputs": [
@@ -244,9 +223,8 @@ class TestParseIndicatorResponse:
         assert result["defaults"]["length"] == 14
         assert "plot_0" in result["plots"]
 
-    def test_output_mapping_added(self):
+    def test_output_mapping_added(self, provider):
         """Output mapping should be added for known indicators."""
-        provider = PineFacadeProvider()
         data = {"inputs": [], "plots": []}
 
         result = provider._parse_indicator_response("STD;RSI", data)
@@ -254,18 +232,16 @@ class TestParseIndicatorResponse:
         assert "output_mapping" in result
         assert result["output_mapping"] == {"plot_0": "value"}
 
-    def test_no_output_mapping_for_unknown(self):
+    def test_no_output_mapping_for_unknown(self, provider):
         """No output mapping for unknown indicators."""
-        provider = PineFacadeProvider()
         data = {"inputs": [], "plots": []}
 
         result = provider._parse_indicator_response("STD;Unknown", data)
 
         assert "output_mapping" not in result
 
-    def test_empty_inputs_and_plots(self):
+    def test_empty_inputs_and_plots(self, provider):
         """Empty inputs and plots should be handled."""
-        provider = PineFacadeProvider()
         data = {}
 
         result = provider._parse_indicator_response("STD;Test", data)
@@ -274,9 +250,8 @@ class TestParseIndicatorResponse:
         assert result["plots"] == {}
         assert result["defaults"] == {}
 
-    def test_input_without_name(self):
+    def test_input_without_name(self, provider):
         """Input without name should get generated name."""
-        provider = PineFacadeProvider()
         data = {
             "inputs": [
                 {"type": "integer", "defval": 14}  # No name
@@ -288,9 +263,8 @@ class TestParseIndicatorResponse:
         assert "in_0" in result["inputs"]
         assert result["inputs"]["in_0"]["defval"] == 14
 
-    def test_plot_without_id(self):
+    def test_plot_without_id(self, provider):
         """Plot without id should get generated id."""
-        provider = PineFacadeProvider()
         data = {
             "plots": [
                 {"type": "line", "title": "Plot"}  # No id
@@ -305,26 +279,20 @@ class TestParseIndicatorResponse:
 class TestGetOutputMapping:
     """Test get_output_mapping method."""
 
-    def test_short_name_mapping(self):
+    def test_short_name_mapping(self, provider):
         """Short name should be normalized and mapping returned."""
-        provider = PineFacadeProvider()
-
         mapping = provider.get_output_mapping("RSI")
 
         assert mapping == {"plot_0": "value"}
 
-    def test_full_id_mapping(self):
+    def test_full_id_mapping(self, provider):
         """Full ID should return mapping."""
-        provider = PineFacadeProvider()
-
         mapping = provider.get_output_mapping("STD;MACD")
 
         assert mapping == {"plot_0": "macd", "plot_1": "signal", "plot_2": "histogram"}
 
-    def test_unknown_indicator_empty_mapping(self):
+    def test_unknown_indicator_empty_mapping(self, provider):
         """Unknown indicator should return empty dict."""
-        provider = PineFacadeProvider()
-
         mapping = provider.get_output_mapping("Unknown")
 
         assert mapping == {}
@@ -334,10 +302,9 @@ class TestGetIndicator:
     """Test get_indicator method."""
 
     @patch.object(PineFacadeProvider, "_fetch_indicator")
-    def test_standard_indicator_no_auth_required(self, mock_fetch):
+    def test_standard_indicator_no_auth_required(self, mock_fetch, provider):
         """Standard indicator should not require auth."""
         mock_fetch.return_value = {"pineId": "STD;RSI", "inputs": {}}
-        provider = PineFacadeProvider()
 
         result = provider.get_indicator("RSI")
 
@@ -345,10 +312,9 @@ class TestGetIndicator:
         mock_fetch.assert_called_once()
 
     @patch("borsapy._providers.pine_facade.get_tradingview_auth")
-    def test_custom_indicator_requires_auth(self, mock_auth):
+    def test_custom_indicator_requires_auth(self, mock_auth, provider):
         """Custom indicator without auth should raise AuthenticationError."""
         mock_auth.return_value = None
-        provider = PineFacadeProvider()
 
         with pytest.raises(AuthenticationError) as exc_info:
             provider.get_indicator("PUB;abc123")
@@ -357,11 +323,10 @@ class TestGetIndicator:
 
     @patch.object(PineFacadeProvider, "_fetch_indicator")
     @patch("borsapy._providers.pine_facade.get_tradingview_auth")
-    def test_custom_indicator_with_explicit_auth(self, mock_auth, mock_fetch):
+    def test_custom_indicator_with_explicit_auth(self, mock_auth, mock_fetch, provider):
         """Custom indicator with explicit auth should work."""
         mock_auth.return_value = None  # No global auth
         mock_fetch.return_value = {"pineId": "PUB;abc123", "inputs": {}}
-        provider = PineFacadeProvider()
 
         result = provider.get_indicator("PUB;abc123", session="my_session", signature="my_sign")
 
@@ -370,11 +335,10 @@ class TestGetIndicator:
 
     @patch.object(PineFacadeProvider, "_fetch_indicator")
     @patch("borsapy._providers.pine_facade.get_tradingview_auth")
-    def test_custom_indicator_with_global_auth(self, mock_auth, mock_fetch):
+    def test_custom_indicator_with_global_auth(self, mock_auth, mock_fetch, provider):
         """Custom indicator with global auth should work."""
         mock_auth.return_value = {"session": "global_sess", "session_sign": "global_sign"}
         mock_fetch.return_value = {"pineId": "USER;xyz789", "inputs": {}}
-        provider = PineFacadeProvider()
 
         result = provider.get_indicator("USER;xyz789")
 
@@ -385,60 +349,32 @@ class TestGetIndicator:
 class TestFetchIndicatorErrors:
     """Test error handling in _fetch_indicator."""
 
-    def test_404_raises_data_not_available(self):
-        """404 error should raise DataNotAvailableError."""
-        provider = PineFacadeProvider()
-
-        # Mock the client to raise an exception with 404
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = Exception("404 Not Found")
-        provider._client.get = MagicMock(return_value=mock_response)
-
-        # Clear cache first
-        clear_indicator_cache()
-
-        with pytest.raises(DataNotAvailableError) as exc_info:
-            provider._fetch_indicator("STD;NotFound", "last", "", "")
-
-        assert "not found" in str(exc_info.value)
-
-    def test_401_raises_auth_error(self):
-        """401 error should raise AuthenticationError."""
-        provider = PineFacadeProvider()
-
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = Exception("401 Unauthorized")
-        provider._client.get = MagicMock(return_value=mock_response)
-
-        clear_indicator_cache()
-
-        with pytest.raises(AuthenticationError) as exc_info:
-            provider._fetch_indicator("PUB;protected", "last", "", "")
-
-        assert "Access denied" in str(exc_info.value)
-
-    def test_403_raises_auth_error(self):
-        """403 error should raise AuthenticationError."""
-        provider = PineFacadeProvider()
-
+    @pytest.mark.parametrize(
+        "status, indicator_id, expected_exc, message",
+        [
+            ("404 Not Found", "STD;NotFound", DataNotAvailableError, "not found"),
+            ("401 Unauthorized", "PUB;protected", AuthenticationError, "Access denied"),
+            ("403 Forbidden", "USER;private", AuthenticationError, "Access denied"),
+        ],
+    )
+    def test_http_error_mapping(
+        self, provider, monkeypatch, status, indicator_id, expected_exc, message
+    ):
+        """404 should raise DataNotAvailableError, 401/403 AuthenticationError."""
         mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = Exception("403 Forbidden")
-        provider._client.get = MagicMock(return_value=mock_response)
+        mock_response.raise_for_status.side_effect = Exception(status)
+        monkeypatch.setattr(provider._client, "get", MagicMock(return_value=mock_response))
 
-        clear_indicator_cache()
-
-        with pytest.raises(AuthenticationError) as exc_info:
-            provider._fetch_indicator("USER;private", "last", "", "")
+        with pytest.raises(expected_exc) as exc_info:
+            provider._fetch_indicator(indicator_id, "last", "", "")
 
-        assert "Access denied" in str(exc_info.value)
+        assert message in str(exc_info.value)
 
-    def test_network_error_raises_data_not_available(self):
+    def test_network_error_raises_data_not_available(self, provider, monkeypatch):
         """Network error should raise DataNotAvailableError."""
-        provider = PineFacadeProvider()
-
-        provider._client.get = MagicMock(side_effect=Exception("Connection timeout"))
-
-        clear_indicator_cache()
+        monkeypatch.setattr(
+            provider._client, "get", MagicMock(side_effect=Exception("Connection timeout"))
+        )
 
         with pytest.raises(DataNotAvailableError) as exc_info:
             provider._fetch_indicator("STD;RSI", "last", "", "")
@@ -488,17 +424,14 @@ class TestModuleCache:
         # Check cache is empty
         assert len(pf_module._indicator_cache) == 0
 
-    def test_cache_stores_results(self):
+    def test_cache_stores_results(self, ok_response):
         """Cache should store fetched results."""
         import borsapy._providers.pine_facade as pf_module
 
         provider = PineFacadeProvider()
-        clear_indicator_cache()
 
         # Mock the client
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"inputs": [], "plots": []}
-        provider._client.get = MagicMock(return_value=mock_response)
+        provider._client.get = MagicMock(return_value=ok_response)
 
         # Fetch indicator
         provider._fetch_indicator("STD;RSI", "last", "", "")
@@ -506,39 +439,41 @@ class TestModuleCache:
         # Check cache has entry
         assert len(pf_module._indicator_cache) == 1
 
+    def test_cache_evicts_least_recently_used(self, ok_response, monkeypatch):
+        """A cache hit should protect the entry from the next eviction."""
+        import borsapy._providers.pine_facade as pf_module
+
+        monkeypatch.setattr(pf_module, "_INDICATOR_CACHE_SIZE", 2)
+        provider = PineFacadeProvider()
+        provider._client.get = MagicMock(return_value=ok_response)
+
+        provider._fetch_indicator("STD;RSI", "last", "", "")
+        provider._fetch_indicator("STD;MACD", "last", "", "")
+        provider._fetch_indicator("STD;RSI", "last", "", "")  # hit
+        provider._fetch_indicator("STD;BB", "last", "", "")
+
+        cached_ids = [key[0] for key in pf_module._indicator_cache]
+        assert cached_ids == ["STD;RSI", "STD;BB"]
+        assert provider._client.get.call_count == 3
+
 
 class TestURLEncoding:
     """Test URL encoding for indicator IDs."""
 
-    def test_semicolon_encoded_in_url(self):
+    def test_semicolon_encoded_in_url(self, provider, mock_get):
         """Semicolon in indicator ID should be URL encoded."""
-        provider = PineFacadeProvider()
-
-        # Mock the client
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"inputs": [], "plots": []}
-        provider._client.get = MagicMock(return_value=mock_response)
-        clear_indicator_cache()
-
         provider._fetch_indicator("STD;RSI", "last", "", "")
 
         # Check URL was called with encoded semicolon
-        call_args = provider._client.get.call_args
+        call_args = mock_get.call_args
         url = call_args[0][0]
         assert "STD%3BRSI" in url  # %3B is encoded semicolon
 
-    def test_percent_encoded_in_url(self):
+    def test_percent_encoded_in_url(self, provider, mock_get):
         """Percent signs should be double-encoded."""
-        provider = PineFacadeProvider()
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"inputs": [], "plots": []}
-        provider._client.get = MagicMock(return_value=mock_response)
-        clear_indicator_cache()
-
         provider._fetch_indicator("STD;Williams%25R", "last", "", "")
 
-        call_args = provider._client.get.call_args
+        call_args = mock_get.call_args
         url = call_args[0][0]
         # %25 becomes %2525 when URL encoded
         assert "STD%3BWilliams%2525R" in url
@@ -547,65 +482,37 @@ class TestURLEncoding:
 class TestAuthHeaders:
     """Test authentication headers are set correctly."""
 
-    def test_headers_with_session_only(self):
+    def test_headers_with_session_only(self, provider, mock_get):
         """Headers should include sessionid cookie when provided."""
-        provider = PineFacadeProvider()
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"inputs": [], "plots": []}
-        provider._client.get = MagicMock(return_value=mock_response)
-        clear_indicator_cache()
-
         provider._fetch_indicator("STD;RSI", "last", "my_session", "")
 
-        call_args = provider._client.get.call_args
+        call_args = mock_get.call_args
         headers = call_args[1]["headers"]
         assert "Cookie" in headers
         assert "sessionid=my_session" in headers["Cookie"]
 
-    def test_headers_with_session_and_signature(self):
+    def test_headers_with_session_and_signature(self, provider, mock_get):
         """Headers should include both cookies when provided."""
-        provider = PineFacadeProvider()
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"inputs": [], "plots": []}
-        provider._client.get = MagicMock(return_value=mock_response)
-        clear_indicator_cache()
-
         provider._fetch_indicator("STD;RSI", "last", "my_session", "my_sign")
 
-        call_args = provider._client.get.call_args
+        call_args = mock_get.call_args
         headers = call_args[1]["headers"]
         assert "sessionid=my_session" in headers["Cookie"]
         assert "sessionid_sign=my_sign" in headers["Cookie"]
 
-    def test_headers_without_auth(self):
+    def test_headers_without_auth(self, provider, mock_get):
         """Headers should not include Cookie when no auth."""
-        provider = PineFacadeProvider()
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"inputs": [], "plots": []}
-        provider._client.get = MagicMock(return_value=mock_response)
-        clear_indicator_cache()
-
         provider._fetch_indicator("STD;RSI", "last", "", "")
 
-        call_args = provider._client.get.call_args
+        call_args = mock_get.call_args
         headers = call_args[1]["headers"]
         assert "Cookie" not in headers
 
-    def test_origin_and_referer_headers(self):
+    def test_origin_and_referer_headers(self, provider, mock_get):
         """Origin and Referer headers should be set."""
-        provider = PineFacadeProvider()
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"inputs": [], "plots": []}
-        provider._client.get = MagicMock(return_value=mock_response)
-        clear_indicator_cache()
-
         provider._fetch_indicator("STD;RSI", "last", "", "")
 
-        call_args = provider._client.get.call_args
+        call_args = mock_get.call_args
         headers = call_args[1]["headers"]
         assert headers["Origin"] == "https://www.tradingview.com"
         assert headers["Referer"] == "https://www.tradingview.com/"
@@ -616,20 +523,16 @@ class TestAuthHeaders:
 class TestIntegration:
     """Integration tests requiring network access."""
 
-    def test_fetch_rsi_metadata(self):
+    def test_fetch_rsi_metadata(self, provider):
         """Fetch real RSI metadata from TradingView."""
-        provider = PineFacadeProvider()
-
         result = provider.get_indicator("RSI")
 
         assert result["pineId"] == "STD;RSI"
         assert "inputs" in result
         assert "plots" in result
 
-    def test_fetch_macd_metadata(self):
+    def test_fetch_macd_metadata(self, provider):
         """Fetch real MACD metadata from TradingView."""
-        provider = PineFacadeProvider()
-
         result = provider.get_indicator("MACD")
 
         assert result["pineId"] == "STD;MACD"
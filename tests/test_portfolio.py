@@ -53,20 +53,10 @@ class TestAssetTypeDetection:
         assert _detect_asset_type("JPY") == "fx"
         assert _detect_asset_type("CHF") == "fx"
 
-    def test_detect_all_65_currencies(self):
-        """Test all 65 supported currencies are detected as fx."""
-        for currency in FX_CURRENCIES:
-            assert _detect_asset_type(currency) == "fx", f"Failed for {currency}"
-
-    def test_detect_metals(self):
-        """Test detection of precious metals."""
-        for metal in FX_METALS:
-            assert _detect_asset_type(metal) == "fx", f"Failed for {metal}"
-
-    def test_detect_commodities(self):
-        """Test detection of commodities."""
-        for commodity in FX_COMMODITIES:
-            assert _detect_asset_type(commodity) == "fx", f"Failed for {commodity}"
+    @pytest.mark.parametrize("symbol", sorted(FX_CURRENCIES | FX_METALS | FX_COMMODITIES))
+    def test_detect_fx_symbols(self, symbol):
+        """Test all supported currencies, metals and commodities are detected as fx."""
+        assert _detect_asset_type(symbol) == "fx"
 
     def test_detect_crypto(self):
         """Test detection of crypto pairs."""
@@ -530,6 +530,25 @@ class TestTVScreenerProvider:
         assert "close" in fields
         assert "sma_50" in fields
 
+    def test_condition_caches_bounded(self):
+        """Test per-condition caches evict the oldest entries when full."""
+        from borsapy._providers.tradingview_screener_native import (
+            _CONDITION_CACHE_SIZE,
+            TVScreenerProvider,
+        )
+
+        provider = TVScreenerProvider()
+        conditions = [f"rsi < {i}" for i in range(_CONDITION_CACHE_SIZE + 10)]
+
+        provider._separate_conditions(conditions)
+        for cond in conditions:
+            provider._get_condition_columns(cond, "1d")
+
+        assert len(provider._condition_is_local) == _CONDITION_CACHE_SIZE
+        assert len(provider._condition_columns) == _CONDITION_CACHE_SIZE
+        assert "rsi < 0" not in provider._condition_is_local
+        assert conditions[-1] in provider._condition_is_local
+
     def test_scan_empty_symbols(self):
         """Test scan with empty symbols."""
         from borsapy._providers.tradingview_screener_native import TVScreenerProvider
@@ -550,6 +569,97 @@ class TestTVScreenerProvider:
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 0
 
+    def test_local_condition_batch_mask(self):
+        """Test vectorized local conditions over an indicator frame."""
+        from borsapy._providers.tradingview_screener_native import (
+            _compile_local_condition_batch,
+        )
+
+        df = pd.DataFrame(
+            {
+                "supertrend_direction": [1, -1, None],
+                "close": [10.0, 8.0, None],
+                "t3": [9.0, 9.0, 9.0],
+            }
+        )
+
+        mask = _compile_local_condition_batch("supertrend_direction == 1")(df)
+        assert mask.tolist() == [True, False, False]
+
+        mask = _compile_local_condition_batch("close > t3")(df)
+        assert mask.tolist() == [True, False, False]
+
+        mask = _compile_local_condition_batch("missing_field > 1")(df)
+        assert mask.tolist() == [False, False, False]
+
+        # NaN fails "!=" like every other operator
+        mask = _compile_local_condition_batch("close != 5")(df)
+        assert mask.tolist() == [True, True, False]
+
+    def test_local_condition_and_chain(self):
+        """Test flat AND chains in local conditions."""
+        from borsapy._providers.tradingview_screener_native import (
+            _compile_local_condition_batch,
+        )
+
+        rows = [
+            {"supertrend_direction": 1.0, "close": 10.0, "t3": 9.0},
+            {"supertrend_direction": 1.0, "close": 8.0, "t3": 9.0},
+            {"supertrend_direction": -1.0, "close": 10.0, "t3": 9.0},
+        ]
+        condition = "supertrend_direction == 1 and close > t3"
+
+        mask = _compile_local_condition_batch(condition)(pd.DataFrame(rows))
+        assert mask.tolist() == [True, False, False]
+
+    @patch("borsapy.technical.calculate_tilson_t3")
+    @patch("borsapy.technical.calculate_supertrend")
+    @patch("borsapy.ticker.Ticker")
+    def test_apply_local_conditions(self, mock_ticker_class, mock_supertrend, mock_t3):
+        """Test local filtering: int direction kept, NaN fails "!=", AND chains split."""
+        from borsapy._providers.tradingview_screener_native import TVScreenerProvider
+
+        closes = {"UP": 10.0, "DOWN": 10.0, "NOT3": 10.0}
+        directions = {"UP": 1, "DOWN": -1, "NOT3": 1}
+        t3_values = {"UP": 9.0, "DOWN": 9.0, "NOT3": float("nan")}
+
+        def make_ticker(symbol):
+            history = pd.DataFrame({"Close": [closes[symbol]] * 30})
+            history.attrs["symbol"] = symbol
+            return MagicMock(history=MagicMock(return_value=history))
+
+        def fake_supertrend(df):
+            n = len(df)
+            return pd.DataFrame(
+                {
+                    "Supertrend": [9.5] * n,
+                    "Supertrend_Direction": [directions[df.attrs["symbol"]]] * n,
+                    "Supertrend_Upper": [11.0] * n,
+                    "Supertrend_Lower": [9.0] * n,
+                }
+            )
+
+        mock_ticker_class.side_effect = make_ticker
+        mock_supertrend.side_effect = fake_supertrend
+        mock_t3.side_effect = lambda df: pd.Series([t3_values[df.attrs["symbol"]]] * len(df))
+
+        provider = TVScreenerProvider()
+        symbols = ["UP", "DOWN", "NOT3"]
+
+        result = provider._apply_local_conditions(symbols, ["supertrend_direction == 1"], "1d")
+        assert result["symbol"].tolist() == ["UP", "NOT3"]
+        assert pd.api.types.is_integer_dtype(result["supertrend_direction"])
+
+        # A NaN field fails "!=" like every other operator
+        result = provider._apply_local_conditions(symbols, ["t3 != 5"], "1d")
+        assert result["symbol"].tolist() == ["UP", "DOWN"]
+
+        # An unsplit AND chain is evaluated clause by clause
+        result = provider._apply_local_conditions(
+            symbols, ["supertrend_direction == 1 and close > t3"], "1d"
+        )
+        assert result["symbol"].tolist() == ["UP"]
+
 
 # =============================================================================
 # Complex Condition Tests
@@ -404,6 +404,18 @@ class TestTechnicalAnalyzer:
         assert "atr_14" in latest
         assert "obv" in latest
 
+    def test_analyzer_caches_indicators(self, ohlcv_df):
+        """Test repeated calls reuse one result without sharing mutations."""
+        ta = TechnicalAnalyzer(ohlcv_df)
+
+        first = ta.sma(20)
+        first.iloc[-1] = -1.0
+        second = ta.sma(20)
+
+        assert len(ta._cache) == 1
+        assert second.iloc[-1] != -1.0
+        pd.testing.assert_series_equal(second, calculate_sma(ohlcv_df, 20))
+
     def test_analyzer_all(self, ohlcv_df):
         """Test all() method returns DataFrame with indicators."""
         ta = TechnicalAnalyzer(ohlcv_df)